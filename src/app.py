@@ -3,8 +3,7 @@
 import streamlit as st
 from streamlit_option_menu import option_menu
 
-import time, tempfile
-from decimal import Decimal
+import time
 
 from functions import *
 from warnings import simplefilter
@@ -36,6 +35,32 @@ with open("./css/style.css") as file:
         unsafe_allow_html= True
     )
 
+# SHARED RESOURCES
+
+@st.cache_resource
+def key_pool():
+    """Kumpulan kunci yang dipakai bersama oleh semua sesi"""
+    return KeyPool()
+
+@st.cache_resource
+def result_cache():
+    """Cache hasil pembacaan pesan yang dipakai bersama oleh semua sesi
+
+    Hanya tingkat memori: pesan hasil dekripsi tidak boleh tersimpan di disk.
+    """
+    return ResultCache()
+
+@st.cache_resource
+def metrics_endpoint():
+    """Endpoint metrik lokal, aktif jika variabel METRICS_PORT diisi"""
+    port = os.environ.get("METRICS_PORT")
+    return METRICS.serve(int(port)) if port else None
+
+@st.cache_data(max_entries= 32, show_spinner= False)
+def preview(buffer):
+    """Thumbnail gambar unggahan, disimpan dalam cache berdasarkan isi file"""
+    return preview_image(buffer)
+
 # MAIN PROGRAM
     
 class MyApp():
@@ -146,7 +171,8 @@ class MyApp():
                 with env_process.container():
                     if img is not None:
                         st.image(
-                            img, caption= img.name, use_column_width= True
+                            preview(img.getvalue()), caption= img.name,
+                            use_column_width= True
                         )
 
                 if cond:
@@ -155,36 +181,76 @@ class MyApp():
                     with env_process.container():
                         with st.spinner("Sedang proses..."):
                             start_time = time.time()
+                            METRICS.count("embed_requests")
 
-                            p, q, r, s, e, t, n, u, d = generate_keys()
-                            keys = f"p, q, r, s, e, t, n, u, d = [{Decimal(p)}, {Decimal(q)}, {Decimal(r)}, {Decimal(s)}, {Decimal(e)}, {Decimal(t)}, {Decimal(n)}, {Decimal(u)}, {Decimal(d)}]"
-                            to_docx(keys, "keys.docx")
-
-                            text = convert_data_size(message)
-                            text_ascii = to_ascii(text)
-
-                            chipertext = []
-                            for char in range(len(text_ascii)):
-                                sym = text_ascii[char] * e % n
-                                chipertext.append(sym)
+                            keys = key_pool().pop()
+                            to_key(keys)
 
-                            chipertext = str(chipertext)
-                            to_docx(chipertext, "chipertext.docx")
-
-                            temp_file = tempfile.NamedTemporaryFile(delete= False)
-                            temp_file.write(img.read())
-                            temp_file.close()
-                            filepath = temp_file.name
-                            res_img = embed_msg(filepath, message)
+                            res_img = embed_secret_array(
+                                decode_image(img.getvalue()), message, keys
+                            )
 
                             finish_time = time.time()
                             times = duration_count(start_time, finish_time)
-                        st.image(res_img, caption= "result.png", use_column_width= True)
+                        st.image(
+                            preview_image(res_img), caption= "result.png",
+                            use_column_width= True
+                        )
+
+                        ## PNG resolusi penuh baru dienkode saat tombol diklik
+                        st.download_button(
+                            "Download", data= lambda: encode_image(res_img),
+                            file_name= "steno_result.png", mime= "image/png",
+                            on_click= "ignore", use_container_width= True,
+                            key= "Unduh gambar hasil"
+                        )
+                        st.download_button(
+                            "Download keys", data= pack_keys(keys), file_name= "keys.key",
+                            mime= "application/octet-stream", on_click= "ignore",
+                            use_container_width= True, key= "Unduh kunci"
+                        )
                         st.info(times)
 
         except Exception as desc:
             self._exceptionMessage(desc)
 
+    def _readSideChipertext(self, image, keys):
+        """Dekripsi chipertext dari file terpisah untuk gambar lama
+
+        Gambar lama menyimpan pesan asli dengan tata letak legacy (tanpa
+        header), sedangkan chipertext disimpan di file terpisah. Hasil dekripsi
+        hanya dipakai jika sama dengan pesan di dalam gambar, sehingga gambar
+        lain tidak menampilkan isi file chipertext bersama.
+
+        Parameters
+        ----------
+        image : NumPy array
+            Array gambar BGR hasil unggahan.
+
+        keys : tuple
+            Kunci dari `read_key`.
+
+        Returns
+        -------
+        self : str or None
+            Pesan hasil dekripsi, atau None jika gambar bukan gambar lama yang
+            cocok dengan chipertext.
+        """
+        if read_frame(image) is not None:
+            return None
+
+        chipertext_path = "./data/keys/chipertext.bin"
+        if not os.path.exists(chipertext_path):
+            chipertext_path = "./data/keys/chipertext.docx"
+        if not os.path.exists(chipertext_path):
+            return None
+
+        try:
+            message = decrypt_chipertext(chipertext_path, keys)
+        except ValueError:
+            return None
+        return message if extract_array(image) == message else None
+
     def _pageReadMsg(self):
         """Halaman untuk membaca pesan di dalam gambar
         """
@@ -203,7 +269,7 @@ class MyApp():
                 )
 
                 keys = st.file_uploader(
-                    "Upload keys", type= ["docx"],
+                    "Upload keys", type= ["key", "docx"],
                     key= "Untuk keys yang disimpan"
                 )
 
@@ -231,7 +297,8 @@ class MyApp():
                 with env_process.container():
                     if img is not None:
                         st.image(
-                            img, caption= img.name, use_column_width= True
+                            preview(img.getvalue()), caption= img.name,
+                            use_column_width= True
                         )
 
                 if cond:
@@ -240,41 +307,45 @@ class MyApp():
                     with env_process.container():
                         with st.spinner("Sedang proses..."):
                             start_time = time.time()
-                            chipertext_doc = get_docx("./data/keys/chipertext.docx")
-
-                            temp_img = tempfile.NamedTemporaryFile(delete= False)
-                            temp_img.write(img.read())
-                            temp_img.close()
-                            imgpath = temp_img.name
-                            text = read_msg(imgpath)
-
-                            temp_doc = tempfile.NamedTemporaryFile(delete= False)
-                            temp_doc.write(keys.read())
-                            temp_doc.close()
-                            docpath = temp_doc.name
-                            p, q, r, s, e, t, n, u, d = read_key(docpath)
-
-                            chipertext_val = [int(x.group()) for x in re.finditer(r'\d+', chipertext_doc)]
-
-                            plaintext_ascii = []
-                            for i in range(len(chipertext_val)):
-                                x = chipertext_val[i] * d % n
-                                plaintext_ascii.append(x)
-                            message = "".join([chr(i) for i in plaintext_ascii])
+                            METRICS.count("read_requests")
+
+                            cache = result_cache()
+                            cache_key = cache.make_key(img.getvalue(), keys.getvalue())
+                            message = cache.get(cache_key)
+
+                            if message is None:
+                                keys_val = read_key(keys.getvalue())
+                                image = decode_image(img.getvalue())
+                                message = read_secret(image, keys_val)
+
+                                ## gambar lama: chipertext tersimpan di file terpisah
+                                if message is None:
+                                    message = self._readSideChipertext(image, keys_val)
+                                if message is not None:
+                                    cache.put(cache_key, message)
                             
                             finish_time = time.time()
                             times = duration_count(start_time, finish_time)
                         st.image(
-                            img, caption= img.name, use_column_width= True
+                            preview(img.getvalue()), caption= img.name,
+                            use_column_width= True
                         )
                         
                         ms_20()
-                        st.text_area(
-                            "Pesan", value= message, disabled= True,
-                            key= "Tampilkan pesan"
-                        )
+                        if message is None:
+                            st.warning("Gambar tidak mengandung pesan", icon= "⚠️")
+                        else:
+                            st.text_area(
+                                "Pesan", value= message, disabled= True,
+                                key= "Tampilkan pesan"
+                            )
                         st.info(times)
 
+                        stats = cache.stats()
+                        show_caption(
+                            f"Cache: {stats['hits']} hit, {stats['misses']} miss", size= 5
+                        )
+
         except Exception as desc:
             self._exceptionMessage(desc)
 
@@ -282,6 +353,8 @@ class MyApp():
         """Main Program
         """
 
+        metrics_endpoint()
+
         with st.container():
             selected = self._navigation()
 
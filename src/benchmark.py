@@ -0,0 +1,403 @@
+# LIBRARY / MODULE / PUSTAKA
+
+import argparse, json, math, platform, random, string, sys, time
+
+from functions import *
+from warnings import simplefilter
+
+simplefilter(action= "ignore", category= FutureWarning)
+
+# HELPERS
+
+def measure(func, repeat= 3, setup= None):
+    """Ukur waktu terbaik dari beberapa kali percobaan
+
+    Parameters
+    ----------
+    func : callable
+        Fungsi yang diukur. Menerima hasil `setup` jika `setup` diisi.
+
+    repeat : int
+        Jumlah percobaan.
+
+    setup : callable or None
+        Dipanggil sebelum setiap percobaan dan tidak ikut diukur.
+
+    Returns
+    -------
+    self : float
+        Waktu tercepat dalam detik.
+    """
+    best = math.inf
+    for _ in range(repeat):
+        arg = setup() if setup is not None else None
+        start_time = time.perf_counter()
+        func(arg) if setup is not None else func()
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+def synthetic_cover(megapixels, seed= 0):
+    """Gambar sampul acak dengan jumlah megapiksel tertentu (rasio 4:3)"""
+    width = int(math.sqrt(megapixels * 1e6 * 4 / 3)) // 3 * 3
+    height = int(megapixels * 1e6 / width)
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, (height, width, 3), dtype= np.uint8)
+
+def synthetic_message(size, seed= 0):
+    """Pesan acak berisi karakter ASCII yang dapat dicetak"""
+    rng = random.Random(seed)
+    return "".join(rng.choice(string.ascii_letters + string.digits + " ") for _ in range(size))
+
+def synthetic_log(size, seed= 0):
+    """Pesan redundan berupa log JSON lines sepanjang `size` karakter"""
+    rng = random.Random(seed)
+    lines, total = [], 0
+    while total < size:
+        line = json.dumps({
+            "ts": 1700000000 + len(lines), "level": rng.choice(["INFO", "WARN", "ERROR"]),
+            "path": rng.choice(["/embed", "/read", "/keygen"]),
+            "status": rng.choice([200, 200, 200, 400, 503]), "ms": rng.randint(1, 500)
+        })
+        lines.append(line)
+        total += len(line) + 1
+    return "\n".join(lines)[:size]
+
+# BENCHMARKS
+
+def bench_steg(megapixels, sizes, repeat= 3, seed= 0):
+    """Benchmark `embed_array` dan `extract_array`
+
+    Kombinasi yang melebihi kapasitas gambar dilewati.
+    """
+    results = []
+    for mp in megapixels:
+        cover = synthetic_cover(mp, seed)
+        height, width, _ = cover.shape
+        limit = capacity(cover.shape)
+
+        for size in sizes:
+            if size > limit:
+                continue
+            rows = math.ceil((FRAME_CHANNELS + size * 8) / (width // 3 * 9))
+            message = synthetic_message(size, seed)
+            stego = embed_array(cover.copy(), message)
+
+            params = {"megapixels": mp, "shape": [height, width], "message_size": size}
+            results.append({
+                "id": f"embed/{mp}MP/{size}B", "params": params,
+                "seconds": measure(
+                    lambda image: embed_array(image, message), repeat,
+                    setup= lambda: cover[:rows].copy()
+                )
+            })
+            results.append({
+                "id": f"read/{mp}MP/{size}B", "params": params,
+                "seconds": measure(lambda: extract_array(stego), repeat)
+            })
+        del cover
+    return results
+
+def bench_compress(sizes, repeat= 3, seed= 0, levels= (1, 6, 9)):
+    """Benchmark tahap kompresi pada pesan log yang redundan
+
+    Waktu embed sudah termasuk kompresi dan waktu read sudah termasuk
+    dekompresi, sehingga dapat dibandingkan langsung dengan codec "none".
+    """
+    results = []
+    for size in sizes:
+        message = synthetic_log(size, seed)
+        rows = math.ceil((FRAME_CHANNELS + size * 8) / (333 * 9))
+        cover = np.random.default_rng(seed).integers(0, 256, (rows, 999, 3), dtype= np.uint8)
+
+        runs = [("none", None)] + [(codec, level) for codec in ("zlib", "lzma") for level in levels]
+        for codec, level in runs:
+            stats = {}
+            stego = embed_array(cover.copy(), message, codec= codec, level= level, stats= stats)
+            name = codec if level is None else f"{codec}-{level}"
+
+            params = {
+                "codec": codec, "level": level, "message_size": size,
+                "stored": stats["stored"], "compression_ratio": round(stats["ratio"], 3),
+                "pixels_saved": stats["pixels_saved"]
+            }
+            results.append({
+                "id": f"embed/{name}/{size}B", "params": params,
+                "seconds": measure(
+                    lambda image: embed_array(image, message, codec= codec, level= level),
+                    repeat, setup= cover.copy
+                )
+            })
+            results.append({
+                "id": f"read/{name}/{size}B", "params": params,
+                "seconds": measure(lambda: extract_array(stego), repeat)
+            })
+    return results
+
+def fermat_prime(min_bit, max_bit, stats= None):
+    """Jalur `generate_prime` sebelumnya sebagai pembanding
+
+    Kandidat acak langsung diuji dengan `prime_fermat` (100 eksponensiasi
+    modular) tanpa penyaringan pembagi kecil.
+    """
+    while True:
+        candidate = random.getrandbits(random.randint(min_bit, max_bit))
+        if candidate % 2 == 0:
+            candidate += 1
+
+        stats["candidates"] += 1
+        stats["tested"] += 1
+        if prime_fermat(candidate):
+            return candidate
+
+def bench_prime(bits, count, seed= 0, paths= ("fermat", "sieve+mr")):
+    """Benchmark pembuatan bilangan prima
+
+    Parameters
+    ----------
+    bits : int
+        Panjang bit bilangan prima.
+
+    count : int
+        Jumlah bilangan prima yang dibuat oleh setiap jalur.
+
+    seed : int
+        Seed untuk `random` agar setiap jalur mendapat urutan acak yang sama.
+
+    paths : tuple
+        Jalur yang diukur: "fermat" (jalur lama) dan/atau "sieve+mr".
+
+    Returns
+    -------
+    self : list
+        Hasil per jalur berisi kandidat per detik dan waktu per bilangan prima.
+    """
+    funcs = {"fermat": fermat_prime, "sieve+mr": generate_prime}
+
+    results = []
+    for name in paths:
+        random.seed(seed)
+        stats = {"candidates": 0, "tested": 0}
+
+        start_time = time.perf_counter()
+        for _ in range(count):
+            funcs[name](bits, bits, stats= stats)
+        elapsed = time.perf_counter() - start_time
+
+        results.append({
+            "id": f"prime/{name}/{bits}", "seconds": elapsed / count,
+            "params": {"bits": bits, "count": count, "seed": seed},
+            "candidates": stats["candidates"], "tested": stats["tested"],
+            "candidates_per_s": stats["candidates"] / elapsed
+        })
+    return results
+
+def bench_keygen(count, seed= 0):
+    """Benchmark `generate_keys` dan `inverse_modular` dengan seed tetap"""
+    random.seed(seed)
+    start_time = time.perf_counter()
+    keys = [generate_keys() for _ in range(count)]
+    elapsed = time.perf_counter() - start_time
+
+    results = [{
+        "id": "keygen", "seconds": elapsed / count,
+        "params": {"count": count, "seed": seed}
+    }]
+    results.append({
+        "id": "inverse_modular", "params": {"count": count, "seed": seed},
+        "seconds": measure(
+            lambda: [inverse_modular(k[0], k[6]) for k in keys], 3
+        ) / count
+    })
+    return results, keys[0]
+
+def bench_cipher(keys, sizes, repeat= 3, seed= 0):
+    """Benchmark enkripsi dan dekripsi
+
+    Membandingkan perulangan per karakter pada halaman aplikasi sebelumnya
+    (`loop`), `encrypt_msg` / `decrypt_msg` (`table`), mode blok (`block`), dan
+    mode hybrid (`hybrid`). Cache cipher dikosongkan di setiap percobaan agar
+    tabel selalu dibangun dari awal. Ukuran chipertext biner setiap mode
+    dicatat di `params`.
+    """
+    p, q, r, s, e, t, n, u, d = keys
+
+    results = []
+    for size in sizes:
+        text = synthetic_message(size, seed)
+        chipertext = encrypt_msg(text, e, n)
+        hybrid = encrypt_chipertext(text, keys, CHIPERTEXT_HYBRID)
+        block = encrypt_chipertext(text, keys, CHIPERTEXT_BLOCK)
+        params = {
+            "message_size": size,
+            "chipertext_size": {
+                "table": CHIPERTEXT_HEADER.size + len(chipertext) * ((n.bit_length() + 7) // 8),
+                "block": len(block), "hybrid": len(hybrid)
+            }
+        }
+
+        runs = {
+            "encrypt/loop": lambda: [x * e % n for x in to_ascii(text)],
+            "decrypt/loop": lambda: "".join([chr(x * d % n) for x in chipertext]),
+            "encrypt/table": lambda: encrypt_msg(text, e, n),
+            "decrypt/table": lambda: decrypt_msg(chipertext, d, n),
+            "encrypt/block": lambda: encrypt_chipertext(text, keys, CHIPERTEXT_BLOCK),
+            "decrypt/block": lambda: decrypt_chipertext(block, keys),
+            "encrypt/hybrid": lambda: encrypt_chipertext(text, keys, CHIPERTEXT_HYBRID),
+            "decrypt/hybrid": lambda: decrypt_chipertext(hybrid, keys)
+        }
+        for name, func in runs.items():
+            results.append({
+                "id": f"{name}/{size}B", "params": params,
+                "seconds": measure(
+                    lambda _: func(), repeat, setup= get_cipher.cache_clear
+                )
+            })
+    return results
+
+def bench_backend(count, sizes, repeat= 3, seed= 0):
+    """Benchmark pembuatan kunci dan cipher massal pada setiap backend
+
+    Setiap backend memakai seed yang sama sehingga kandidat prima dan kunci
+    yang dihasilkan identik. Backend yang aktif dikembalikan setelah selesai.
+    """
+    active = BACKEND.name_
+
+    results = []
+    try:
+        for name in BACKENDS:
+            set_backend(name)
+            random.seed(seed)
+            start_time = time.perf_counter()
+            keys = [generate_keys() for _ in range(count)]
+            results.append({
+                "id": f"keygen/{name}", "seconds": (time.perf_counter() - start_time) / count,
+                "params": {"backend": name, "count": count, "seed": seed}
+            })
+
+            for size in sizes:
+                text = synthetic_message(size, seed)
+                params = {"backend": name, "message_size": size}
+                for mode in ("char", "block"):
+                    chipertext = encrypt_chipertext(text, keys[0], CIPHER_MODES[mode])
+                    runs = {
+                        f"encrypt/{mode}": lambda: encrypt_chipertext(text, keys[0], CIPHER_MODES[mode]),
+                        f"decrypt/{mode}": lambda: decrypt_chipertext(chipertext, keys[0])
+                    }
+                    for run, func in runs.items():
+                        results.append({
+                            "id": f"{run}/{name}/{size}B", "params": params,
+                            "seconds": measure(
+                                lambda _: func(), repeat, setup= get_cipher.cache_clear
+                            )
+                        })
+    finally:
+        set_backend(active)
+    return results
+
+# BASELINE
+
+def compare(results, baseline, tolerance):
+    """Bandingkan hasil dengan baseline
+
+    Parameters
+    ----------
+    results : list
+        Hasil benchmark saat ini.
+
+    baseline : dict
+        Isi file JSON hasil benchmark sebelumnya.
+
+    tolerance : float
+        Batas kenaikan waktu relatif yang masih diterima (0.2 = 20%).
+
+    Returns
+    -------
+    self : list
+        Daftar id benchmark yang mengalami regresi.
+    """
+    previous = {row["id"]: row["seconds"] for row in baseline["results"]}
+
+    regressions = []
+    for row in results:
+        if row["id"] not in previous:
+            continue
+        ratio = row["seconds"] / max(previous[row["id"]], 1e-12)
+        row["baseline_seconds"] = previous[row["id"]]
+        row["ratio"] = ratio
+        if ratio > 1 + tolerance:
+            regressions.append(row["id"])
+    return regressions
+
+# MAIN PROGRAM
+
+def main(argv= None):
+    parser = argparse.ArgumentParser(
+        description= "Benchmark steganografi, pembuatan kunci, dan cipher."
+    )
+    parser.add_argument(
+        "--bench", nargs= "+", default= ["steg", "compress", "prime", "keygen", "cipher", "backend"],
+        choices= ["steg", "compress", "prime", "keygen", "cipher", "backend"]
+    )
+    parser.add_argument("--megapixels", type= float, nargs= "+", default= [0.3, 12, 100])
+    parser.add_argument("--sizes", type= int, nargs= "+", default= [1024, 16384, 262144])
+    parser.add_argument("--bits", type= int, nargs= "+", default= [1024, 2048])
+    parser.add_argument("--count", type= int, default= 3)
+    parser.add_argument("--repeat", type= int, default= 3)
+    parser.add_argument("--seed", type= int, default= 0)
+    parser.add_argument(
+        "--no-legacy", action= "store_true",
+        help= "Lewati jalur Fermat lama pada benchmark prime."
+    )
+    parser.add_argument("--json", default= None, help= "Simpan hasil ke file JSON.")
+    parser.add_argument("--baseline", default= None, help= "File JSON hasil sebelumnya.")
+    parser.add_argument("--tolerance", type= float, default= 0.2)
+    args = parser.parse_args(argv)
+
+    results, keys = [], None
+    if "steg" in args.bench:
+        results += bench_steg(args.megapixels, args.sizes, args.repeat, args.seed)
+    if "compress" in args.bench:
+        results += bench_compress(args.sizes, args.repeat, args.seed)
+    if "prime" in args.bench:
+        paths = ("sieve+mr",) if args.no_legacy else ("fermat", "sieve+mr")
+        for bits in args.bits:
+            results += bench_prime(bits, args.count, args.seed, paths)
+    if "keygen" in args.bench or "cipher" in args.bench:
+        rows, keys = bench_keygen(args.count, args.seed)
+        if "keygen" in args.bench:
+            results += rows
+    if "cipher" in args.bench:
+        results += bench_cipher(keys, args.sizes, args.repeat, args.seed)
+    if "backend" in args.bench:
+        results += bench_backend(args.count, args.sizes, args.repeat, args.seed)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding= "utf-8") as file:
+            regressions = compare(results, json.load(file), args.tolerance)
+
+    for row in results:
+        line = f"{row['id']:<36}{row['seconds']:>12.6f} s"
+        if "compression_ratio" in row["params"]:
+            line += f"  (kompresi {row['params']['compression_ratio']:.2f}x)"
+        if "ratio" in row:
+            line += f"{row['ratio']:>8.2f}x"
+            if row["id"] in regressions:
+                line += "  REGRESI"
+        print(line)
+
+    if args.json:
+        report = {
+            "python": platform.python_version(), "machine": platform.machine(),
+            "numpy": np.__version__, "backend": BACKEND.name_, "args": vars(args), "results": results
+        }
+        with open(args.json, "w", encoding= "utf-8") as file:
+            json.dump(report, file, indent= 2)
+
+    if regressions:
+        print(f"{len(regressions)} benchmark lebih lambat dari baseline", file= sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
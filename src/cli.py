@@ -0,0 +1,265 @@
+# LIBRARY / MODULE / PUSTAKA
+
+import argparse, csv, json, os, sys, time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from functions import *
+from warnings import simplefilter
+
+simplefilter(action= "ignore", category= FutureWarning)
+
+# JOBS
+
+def embed_job(job):
+    """Jalankan satu pekerjaan penyematan pesan
+
+    Setara dengan satu kali submit pada halaman "Embed Message": buat kunci,
+    enkripsi pesan, simpan kunci dan chipertext, lalu sematkan pesan ke dalam
+    gambar. Jika `self_contained` bernilai True, chipertext disematkan ke
+    dalam gambar sehingga tidak ada file chipertext terpisah.
+
+    Parameters
+    ----------
+    job : dict
+        Baris manifest dengan kolom `image`, `message`, `outdir`, `bits`,
+        `codec`, `level`, `self_contained`, `cipher`, dan opsional `name`
+        sebagai awalan nama file hasil.
+
+    Returns
+    -------
+    self : dict
+        Ringkasan hasil pekerjaan.
+    """
+    name = job.get("name") or os.path.splitext(os.path.basename(job["image"]))[0]
+    outdir = job["outdir"]
+
+    keys = generate_keys()
+    to_key(keys, f"{name}_keys.key", outdir)
+    mode = CIPHER_MODES[job["cipher"]]
+
+    output, stats = f"{outdir}/{name}.png", {}
+    if job["self_contained"]:
+        with open(job["image"], "rb") as file:
+            image = embed_secret(
+                file.read(), job["message"], keys, int(job["bits"]),
+                job["codec"], job["level"], stats, mode
+            )
+        with open(output, "wb") as file:
+            file.write(image)
+        return {
+            "image": job["image"], "output": output,
+            "keys": f"{outdir}/{name}_keys.key", "compression": stats
+        }
+
+    with open(f"{outdir}/{name}_chipertext.bin", "wb") as file:
+        file.write(encrypt_chipertext(job["message"], keys, mode))
+
+    embed_msg(
+        job["image"], job["message"], output= output, bits= int(job["bits"]),
+        codec= job["codec"], level= job["level"], stats= stats
+    )
+    return {
+        "image": job["image"], "output": output,
+        "keys": f"{outdir}/{name}_keys.key",
+        "chipertext": f"{outdir}/{name}_chipertext.bin",
+        "compression": stats
+    }
+
+def read_job(job):
+    """Jalankan satu pekerjaan pembacaan pesan
+
+    Setara dengan satu kali klik pada halaman "Read Message": dekripsi
+    chipertext yang tersemat di gambar menggunakan kunci. Untuk gambar lama,
+    pesan diekstrak dari gambar dan chipertext dibaca dari file terpisah.
+
+    Parameters
+    ----------
+    job : dict
+        Baris manifest dengan kolom `image`, `key`, `chipertext`, `bits`, dan
+        `legacy`.
+
+    Returns
+    -------
+    self : dict
+        Ringkasan hasil pekerjaan.
+    """
+    keys = read_key(job["key"])
+    with open(job["image"], "rb") as file:
+        image = decode_image(file.read())
+
+    message = read_secret(image, keys)
+    if message is not None:
+        return {"image": job["image"], "message": message}
+
+    text = read_buffer(image, bits= int(job["bits"]), legacy= job["legacy"])
+    message = decrypt_chipertext(job["chipertext"], keys)
+    return {"image": job["image"], "extracted": text, "message": message}
+
+def run_job(mode, job):
+    """Jalankan pekerjaan dan tangkap error agar batch tetap berjalan"""
+    start_time = time.time()
+    try:
+        result = (embed_job if mode == "embed" else read_job)(job)
+        result["status"] = "ok"
+    except Exception as desc:
+        result = {"image": job.get("image"), "status": "error", "error": repr(desc)}
+    result["seconds"] = round(time.time() - start_time, 4)
+    return result
+
+def run_batch(mode, jobs, workers, retries= 1):
+    """Jalankan semua pekerjaan di pool proses
+
+    Jika proses worker mati (misal kehabisan memori), pool menjadi rusak dan
+    semua pekerjaan yang belum selesai gagal. Pekerjaan tersebut dijalankan
+    ulang di pool baru sebanyak `retries` kali, lalu dicatat sebagai error
+    agar batch tetap selesai dan laporan tetap ditulis.
+
+    Returns
+    -------
+    self : list
+        Hasil `run_job` untuk setiap pekerjaan, sesuai urutan selesai.
+    """
+    results, remaining = [], list(jobs)
+    for _ in range(retries + 1):
+        broken = []
+        with ProcessPoolExecutor(max_workers= workers) as pool:
+            futures = {}
+            for job in remaining:
+                try:
+                    futures[pool.submit(run_job, mode, job)] = job
+                except BrokenProcessPool:
+                    broken.append(job)
+            for future in as_completed(futures):
+                try:
+                    results.append(future.result())
+                except BrokenProcessPool:
+                    broken.append(futures[future])
+
+        remaining = broken
+        if not remaining:
+            break
+
+    for job in remaining:
+        results.append({
+            "image": job.get("image"), "status": "error",
+            "error": "Proses worker berhenti tiba-tiba.", "seconds": 0.0
+        })
+    return results
+
+# MAIN PROGRAM
+
+def load_manifest(filepath, mode, outdir, chipertext, bits= 1, codec= "none", level= None, self_contained= False, cipher= "hybrid", legacy= True):
+    """Baca manifest CSV
+
+    Kolom yang dibutuhkan adalah `image,message` untuk mode embed dan
+    `image,key` untuk mode read. Kolom `chipertext` pada mode read dan kolom
+    `bits` (jumlah bit LSB per kanal) bersifat opsional.
+    """
+    required = ["image", "message"] if mode == "embed" else ["image", "key"]
+
+    with open(filepath, newline= "", encoding= "utf-8") as file:
+        jobs = list(csv.DictReader(file))
+
+    for id, job in enumerate(jobs):
+        missing = [col for col in required if not job.get(col)]
+        if missing:
+            raise ValueError(f"Baris {id + 2} manifest tidak memiliki kolom {missing}")
+        job["outdir"] = outdir
+        job["chipertext"] = job.get("chipertext") or chipertext
+        job["bits"] = job.get("bits") or bits
+        job["codec"], job["level"] = codec, level
+        job["self_contained"], job["cipher"] = self_contained, cipher
+        job["legacy"] = legacy
+    return jobs
+
+def main(argv= None):
+    parser = argparse.ArgumentParser(
+        description= "Batch embed / read pesan steganografi tanpa UI Streamlit."
+    )
+    parser.add_argument("mode", choices= ["embed", "read"])
+    parser.add_argument("manifest", help= "File CSV berisi daftar pekerjaan.")
+    parser.add_argument(
+        "-w", "--workers", type= int, default= os.cpu_count(),
+        help= "Jumlah proses paralel (default: jumlah CPU)."
+    )
+    parser.add_argument(
+        "-o", "--outdir", default= "./data/batch",
+        help= "Folder hasil untuk mode embed."
+    )
+    parser.add_argument(
+        "-c", "--chipertext", default= "./data/keys/chipertext.bin",
+        help= "Chipertext default untuk mode read."
+    )
+    parser.add_argument(
+        "-b", "--bits", type= int, default= 1, choices= range(1, 5),
+        help= "Jumlah bit LSB per kanal (default: 1)."
+    )
+    parser.add_argument(
+        "--codec", default= "none", choices= list(CODECS),
+        help= "Kompresi pesan sebelum disematkan (default: none)."
+    )
+    parser.add_argument(
+        "--level", type= int, default= None, choices= range(10),
+        help= "Tingkat kompresi 0 - 9 (default: bawaan codec)."
+    )
+    parser.add_argument(
+        "-s", "--self-contained", action= "store_true",
+        help= "Sematkan chipertext ke dalam gambar, tanpa file chipertext terpisah."
+    )
+    parser.add_argument(
+        "--cipher", default= "hybrid", choices= list(CIPHER_MODES),
+        help= "Mode enkripsi chipertext (default: hybrid)."
+    )
+    parser.add_argument(
+        "--no-legacy", dest= "legacy", action= "store_false",
+        help= "Tolak gambar tanpa header pesan alih-alih memindai format lama."
+    )
+    parser.add_argument(
+        "-r", "--report", default= None,
+        help= "Simpan hasil setiap pekerjaan ke file JSON lines."
+    )
+    args = parser.parse_args(argv)
+
+    jobs = load_manifest(
+        args.manifest, args.mode, args.outdir, args.chipertext,
+        args.bits, args.codec, args.level, args.self_contained, args.cipher,
+        args.legacy
+    )
+    mk_dir(args.outdir)
+
+    start_time = time.time()
+    results = run_batch(args.mode, jobs, args.workers)
+    finish_time = time.time()
+
+    failed = 0
+    for result in results:
+        if result["status"] != "ok":
+            failed += 1
+            print(f"[error] {result['image']}: {result['error']}", file= sys.stderr)
+
+    if args.report:
+        with open(args.report, "w", encoding= "utf-8") as file:
+            for result in results:
+                file.write(json.dumps(result) + "\n")
+
+    elapsed = max(finish_time - start_time, 1e-9)
+    print(duration_count(start_time, finish_time))
+
+    compressed = [result["compression"] for result in results if result.get("compression")]
+    if args.codec != "none" and compressed:
+        original = sum(stats["original"] for stats in compressed)
+        stored = sum(stats["stored"] for stats in compressed)
+        saved = sum(stats["saved_seconds"] for stats in compressed)
+        print(
+            f"Kompresi {args.codec}: {original} -> {stored} byte "
+            f"({original / max(stored, 1):.2f}x), estimasi waktu dihemat {saved:.4f} detik"
+        )
+    print(
+        f"{len(jobs)} pekerjaan ({failed} gagal) dengan {args.workers} proses, "
+        f"{len(jobs) / elapsed:.2f} gambar/detik"
+    )
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,9 +4,22 @@ import streamlit as st
 import pandas as pd
 from docx import Document
 import cv2
-import os, math, random, re
+import numpy as np
+import os, math, random, re, shutil, json, threading, uuid
+import functools, multiprocessing, hashlib, mmap, struct, io, time, contextlib, zlib, lzma
+import queue
+import hmac, secrets, logging, zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from collections import deque, OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from decimal import Decimal
 
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
 from warnings import simplefilter
 
 simplefilter(action= "ignore", category= FutureWarning)
@@ -200,369 +213,2952 @@ def duration_count(start, finish, msg= "berlalu"):
     return text
 
 # CUSTOM FUNCTIONS
-        
-def embed_msg(filepath: str, message: str):
-    """Image based Steganography using Least Significant Bit
 
-    Menyematkan pesan dalam gambar dengan teknik LSB (Least Significant Bit)
-    dengan memanipulasi bit-bit piksel gambar tanpa mengubah tampilan visual
-    secara signifikan.
+"""Metrics
+
+Instrumentasi ringan untuk mengukur waktu setiap tahap proses (pembuatan
+kunci, serialisasi kunci dan chipertext, dekode gambar, embed/extract, dan
+enkode gambar). Setiap tahap dicatat sebagai penghitung dan histogram, lalu
+dapat diekspor melalui endpoint HTTP lokal atau file JSON lines.
+"""
+
+HISTOGRAM_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60)
+
+class Metrics():
+    """Kumpulan penghitung dan histogram waktu per tahap
 
     Parameters
     ----------
-    filepath : str
-        Jalur file gambar yang akan diolah.
-    
-    message : str
-        Pesan yang akan disematkan ke dalam gambar.
+    logpath_ : str or None
+        Jika diisi, setiap pengukuran ditambahkan ke file JSON lines ini.
+        Aman dipakai dari beberapa proses sekaligus.
 
-    Returns
-    -------
-    image : NumPy array
-        Mengembalikkan NumPy array yang mengandung nilai piksel dari gambar
-        dalam format BGR (blue-green-red).
+    Attributes
+    ----------
+    counters_ : dict
+        Jumlah kejadian per nama penghitung.
+
+    histograms_ : dict
+        Per tahap: jumlah pengamatan per batas `HISTOGRAM_BUCKETS`, total
+        detik, dan jumlah pengamatan.
     """
-    image = cv2.imread(filepath)
 
-    message = [format(ord(i), "08b") for i in message]
-    _, width, _ = image.shape
-
-    pixel_req = len(message) * 3
-    row_req = pixel_req / width
-    row_req = math.ceil(row_req)
-
-    count, char_count = 0, 0
-    for i in range(row_req + 1):
-        while count < width and char_count < len(message):
-            char = message[char_count]
-            char_count += 1
-            for id, bit in enumerate(char):
-                if (bit == "1" and image[i][count][id % 3] % 2 == 0) or \
-                (bit == "0" and image[i][count][id % 3] % 2 == 1):
-                    image[i][count][id % 3] -= 1
-
-                if id % 3 == 2:
-                    count += 1
-
-                if id == 7:
-                    if char_count * 3 < pixel_req and image[i][count][2] % 2 == 1:
-                        image[i][count][2] -= 1
-                    if char_count * 3 >= pixel_req and image[i][count][2] % 2 == 0:
-                        image[i][count][2] -= 1
-                    count += 1
-        count = 0
-    mk_dir("./data/images")
-    cv2.imwrite("./data/images/steno_result.png", image)
-    image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-    return image
+    def __init__(self, logpath_= None):
+        self.logpath_ = logpath_
+        self.counters_ = defaultdict(int)
+        self.histograms_ = {}
+        self.lock_ = threading.Lock()
+
+    def count(self, name, value= 1):
+        """Tambah nilai penghitung"""
+        with self.lock_:
+            self.counters_[name] += value
+
+    def observe(self, name, seconds):
+        """Catat durasi satu tahap"""
+        with self.lock_:
+            hist = self.histograms_.setdefault(
+                name, {"buckets": [0] * len(HISTOGRAM_BUCKETS), "sum": 0.0, "count": 0}
+            )
+            for id, bound in enumerate(HISTOGRAM_BUCKETS):
+                if seconds <= bound:
+                    hist["buckets"][id] += 1
+            hist["sum"] += seconds
+            hist["count"] += 1
+
+        if self.logpath_:
+            line = json.dumps({
+                "ts": time.time(), "pid": os.getpid(),
+                "stage": name, "seconds": seconds
+            })
+            with open(self.logpath_, "a", encoding= "utf-8") as file:
+                file.write(line + "\n")
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Context manager untuk mengukur waktu satu tahap"""
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start_time)
+
+    def timed(self, name):
+        """Decorator untuk mengukur waktu setiap pemanggilan fungsi"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.stage(name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def snapshot(self):
+        """Salinan seluruh penghitung dan histogram dalam bentuk dict"""
+        with self.lock_:
+            return {
+                "counters": dict(self.counters_),
+                "histograms": {
+                    name: {
+                        "buckets": dict(zip(map(str, HISTOGRAM_BUCKETS), hist["buckets"])),
+                        "sum": hist["sum"], "count": hist["count"]
+                    } for name, hist in self.histograms_.items()
+                }
+            }
+
+    def to_prometheus(self):
+        """Format teks Prometheus dari seluruh metrik"""
+        data = self.snapshot()
+        lines = []
+        for name, value in sorted(data["counters"].items()):
+            lines.append(f"# TYPE binmr_{name}_total counter")
+            lines.append(f"binmr_{name}_total {value}")
+        lines.append("# TYPE binmr_stage_seconds histogram")
+        for name, hist in sorted(data["histograms"].items()):
+            for bound, value in hist["buckets"].items():
+                lines.append(f'binmr_stage_seconds_bucket{{stage="{name}",le="{bound}"}} {value}')
+            lines.append(f'binmr_stage_seconds_bucket{{stage="{name}",le="+Inf"}} {hist["count"]}')
+            lines.append(f'binmr_stage_seconds_sum{{stage="{name}"}} {hist["sum"]}')
+            lines.append(f'binmr_stage_seconds_count{{stage="{name}"}} {hist["count"]}')
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port= 9100, host= "127.0.0.1"):
+        """Jalankan endpoint metrik lokal di thread latar belakang
+
+        `/metrics` mengembalikan format teks Prometheus dan `/metrics.json`
+        mengembalikan `snapshot` dalam JSON.
 
-def read_msg(filepath: str):
-    """Extract hidden message
+        Returns
+        -------
+        server : ThreadingHTTPServer
+            Server yang sedang berjalan. Panggil `shutdown()` untuk berhenti.
+        """
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/metrics":
+                    body, kind = metrics.to_prometheus(), "text/plain; version=0.0.4"
+                elif self.path == "/metrics.json":
+                    body, kind = json.dumps(metrics.snapshot()), "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                body = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", kind)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target= server.serve_forever, daemon= True).start()
+        return server
+
+METRICS = Metrics(logpath_= os.environ.get("METRICS_LOG"))
+LOGGER = logging.getLogger("functions")
+
+"""Arithmetic Backend
+
+Operasi bilangan besar pada pembuatan kunci dan cipher (pangkat modular,
+invers modular, dan perkalian modular) dijalankan melalui `BACKEND`. gmpy2
+dipakai jika terpasang, dan int Python jika tidak. Backend dapat dipilih
+dengan variabel lingkungan `VS_BACKEND` (`python` atau `gmpy2`) atau dengan
+`set_backend`. Semua hasil dikembalikan sebagai int Python.
+"""
 
-    Baca pesan yang disembunyikan dalam suatu gambar dengan ekstraksi teknik LSB.
+class PythonBackend():
+    """Backend int Python (tanpa dependensi tambahan)"""
+
+    name_ = "python"
+
+    def powmod(self, base, exp, mod):
+        return pow(base, exp, mod)
+
+    def invert(self, num, mod):
+        """Invers modular, ValueError jika tidak ada"""
+        return pow(num, -1, mod)
+
+    def mulmod(self, a, b, mod):
+        return a * b % mod
+
+    def gcdext(self, a, b):
+        """PBB dan koefisien `x, y` yang memenuhi `ax + by = PBB(a, b)`"""
+        D1, D2 = a, b
+        X1, X2 = 1, 0
+        Y1, Y2 = 0, 1
+
+        while D2 > 0:
+            K = D1 // D2
+            D1, D2 = D2, D1 - K * D2
+            X1, X2 = X2, X1 - K * X2
+            Y1, Y2 = Y2, Y1 - K * Y2
+        return D1, X1, Y1
+
+class Gmpy2Backend():
+    """Backend gmpy2 (GMP) untuk bilangan ribuan bit"""
+
+    name_ = "gmpy2"
+
+    def powmod(self, base, exp, mod):
+        return int(gmpy2.powmod(base, exp, mod))
+
+    def invert(self, num, mod):
+        """Invers modular, ValueError jika tidak ada"""
+        try:
+            return int(gmpy2.invert(num, mod))
+        except ZeroDivisionError:
+            raise ValueError("base is not invertible for the given modulus")
+
+    def mulmod(self, a, b, mod):
+        return int(gmpy2.mpz(a) * b % mod)
+
+    def gcdext(self, a, b):
+        """PBB dan koefisien `x, y` yang memenuhi `ax + by = PBB(a, b)`"""
+        return tuple(int(x) for x in gmpy2.gcdext(a, b))
+
+BACKENDS = {"python": PythonBackend}
+if gmpy2 is not None:
+    BACKENDS["gmpy2"] = Gmpy2Backend
+
+def set_backend(name= None):
+    """Pilih backend aritmetika
 
     Parameters
     ----------
-    filepath : str
-        Jalur gambar yang memiliki pesan disematkan.
+    name : str or None
+        "python" atau "gmpy2". None berarti gmpy2 jika terpasang.
 
     Returns
     -------
-    self : str
-        Pesan yang berhasil diekstrak dari gambar.
+    self : object
+        Backend yang aktif.
     """
-    image = cv2.imread(filepath)
-
-    data, stop = [], False
-    for row in image:
-        row.tolist()
-        for id, pixel in enumerate(row):
-            if id % 3 == 2:
-                data.append(bin(pixel[0])[-1])
-                data.append(bin(pixel[1])[-1])
-
-                if bin(pixel[2])[-1] == "1":
-                    stop = True
-                    break
-            else:
-                data.append(bin(pixel[0])[-1])
-                data.append(bin(pixel[1])[-1])
-                data.append(bin(pixel[2])[-1])
-        if stop:
-            break
+    global BACKEND
+    if name is None:
+        name = "gmpy2" if "gmpy2" in BACKENDS else "python"
+    if name not in BACKENDS:
+        raise ValueError(f"Backend '{name}' tidak tersedia, pilih salah satu dari {list(BACKENDS)}.")
+    BACKEND = BACKENDS[name]()
+    return BACKEND
+
+BACKEND = set_backend(os.environ.get("VS_BACKEND") or None)
+
+"""LSB Layout
+
+Setiap karakter pesan menempati satu slot berupa 3 piksel berurutan dalam satu
+baris gambar (9 kanal). Delapan kanal pertama menyimpan bit karakter (MSB
+terlebih dahulu) dan kanal terakhir, yaitu kanal 2 dari piksel ketiga, menyimpan
+penanda lanjut (0) atau berhenti (1). Slot diisi dari kiri ke kanan, baris demi
+baris, dengan `width // 3` slot per baris.
+
+Pada mode k-LSB (`bits` = k, 1 - 4), setiap kanal menyimpan k bit terbawah
+sehingga satu slot memuat 9k bit: k byte data, k - 1 bit jumlah byte valid
+pada slot terakhir (dikurangi 1), dan bit penanda pada LSB kanal terakhir.
+Mode k = 1 identik dengan tata letak di atas.
+
+Tata letak ini disebut mode legacy. Penyematan baru memakai Framed Layout
+(lihat di bawah) yang tetap memakai urutan kanal yang sama.
+"""
 
-    message = []
-    for i in range(int((len(data) + 1) / 8)):
-        message.append(data[i * 8:(i * 8 + 8)])
-    message = [chr(int("".join(i), 2)) for i in message]
-    return "".join(message)
+def to_payload(message):
+    """Ubah pesan menjadi bytes (str dikodekan sebagai Latin-1)"""
+    if isinstance(message, str):
+        return message.encode("latin-1")
+    return bytes(message)
 
-def to_ascii(text):
-    """Mengonversi pesan teks ke dalam bentuk ASCII.
+def capacity(shape, bits= 1, framed= True):
+    """Kapasitas gambar
 
     Parameters
     ----------
-    text : str
-        Teks atau pesan yang akan diolah.
+    shape : tuple
+        Bentuk array gambar `(height, width, channels)`.
+
+    bits : int
+        Jumlah bit per kanal (1 - 4).
+
+    framed : bool
+        Hitung kapasitas Framed Layout (dikurangi header) jika True, atau
+        tata letak legacy jika False.
 
     Returns
     -------
-    self : list
-        Daftar yang berisi nilai ASCII setiap karakter.
+    self : int
+        Jumlah byte pesan maksimum yang dapat disematkan.
     """
-    ascii_form = []
-    for char in text:
-        ascii_form.append(ord(char))
-    return ascii_form
+    if not 1 <= bits <= 4:
+        raise ValueError("Jumlah bit per kanal harus antara 1 dan 4.")
+    if not framed:
+        return shape[0] * (shape[1] // 3) * bits
+    channels = shape[0] * (shape[1] // 3) * 9
+    return max(channels - FRAME_CHANNELS, 0) * bits // 8
+
+def check_capacity(shape, size, bits= 1, framed= True):
+    """Tolak pesan yang melebihi kapasitas sebelum ada piksel yang diubah"""
+    limit = capacity(shape, bits, framed)
+    if framed and shape[0] * (shape[1] // 3) * 9 < FRAME_CHANNELS:
+        raise ValueError("Gambar terlalu kecil untuk menyimpan header pesan.")
+    if size > limit:
+        raise ValueError(
+            f"Pesan terlalu panjang: {size} byte, kapasitas gambar {limit} byte "
+            f"({bits} bit per kanal)."
+        )
 
-def convert_data_size(text, size_bit= None):
-    """Konversi data menjadi ukuran tertentu dalam byte.
+def to_bits(message, bits= 1):
+    """Bangun aliran bit pesan
 
     Parameters
     ----------
-    text : str
-        Data atau pesan yang akan dikonversi.
+    message : str or bytes
+        Pesan dengan karakter dalam rentang Latin-1 (kode 0 - 255).
 
-    size_bit : int
-        Ukuran target dalam bit.
+    bits : int
+        Jumlah bit per kanal (1 - 4).
 
-    Return
-    ------
-    self : str
-        Teks dalam format ASCII yang telah dikonversi ukuran bit-nya.
+    Returns
+    -------
+    bits : NumPy array
+        Array uint8 berukuran `(jumlah slot, 9)` berisi nilai k bit untuk
+        setiap kanal slot. Untuk k = 1 berisi 8 bit data dan bit penanda.
     """
-    if size_bit is None:
-        size_bit = len(text.encode("utf-8")) * 8
-    
-    thresh = int(size_bit / 8)
+    data = np.frombuffer(to_payload(message), dtype= np.uint8)
+    count = math.ceil(len(data) / bits)
 
-    while len(text.encode("utf-8")) < thresh:
-        text += " "
+    padded = np.zeros(count * bits, dtype= np.uint8)
+    padded[:len(data)] = data
 
-    bit_text = text.encode("utf-8")[:thresh]
-    return bit_text.decode("utf-8")
+    stream = np.zeros((count, 9 * bits), dtype= np.uint8)
+    stream[:, :8 * bits] = np.unpackbits(padded.reshape(count, bits), axis= 1)
+    if not count:
+        return stream
 
-def prime_fermat(num, num_tests= 100):
-    """Prime with Fermat Test
+    if bits > 1:
+        valid = np.full((count, 1), bits - 1, dtype= np.uint8)
+        valid[-1] = len(data) - (count - 1) * bits - 1
+        stream[:, 8 * bits:-1] = np.unpackbits(valid, axis= 1)[:, 9 - bits:]
+    stream[-1, -1] = 1
 
-    Cek apakah suatu bilangan adalah bilangan prima secara probabilitas dengan
-    Uji Fermat.
+    if bits == 1:
+        return stream
+    return np.packbits(stream.reshape(count, 9, bits), axis= 2)[:, :, 0] >> (8 - bits)
+
+@METRICS.timed("embed")
+def embed_array(image, message, bits= 1, framed= True, codec= "none", level= None, stats= None, flags= 0):
+    """Sematkan pesan ke dalam array gambar
+
+    Versi vektor dari penyematan LSB. Seluruh aliran bit dibangun sekaligus
+    lalu ditulis ke slot piksel dalam beberapa operasi array. Pada k = 1, nilai
+    kanal yang LSB-nya tidak sesuai dikurangi 1 (0 menjadi 255), sama persis
+    dengan perilaku penyematan per bit sebelumnya.
 
     Parameters
     ----------
-    num : int
-        Bilangan yang akan diperiksa
+    image : NumPy array
+        Array gambar BGR uint8 yang akan diubah secara langsung (in-place).
 
-    num_tests : int
-        Jumlah perulangan dalam uji coba Fermat yang dilakukan.
+    message : str or bytes
+        Pesan yang akan disematkan.
+
+    bits : int
+        Jumlah bit per kanal (1 - 4).
+
+    framed : bool
+        Gunakan Framed Layout jika True, atau tata letak legacy (penanda
+        berhenti) jika False.
+
+    codec : str
+        Codec kompresi payload: "none", "zlib", atau "lzma". Hanya untuk
+        Framed Layout.
+
+    level : int or None
+        Tingkat kompresi 0 - 9. None berarti default codec.
+
+    stats : dict or None
+        Jika diisi, diperbarui dengan ringkasan `compression_stats`.
+
+    flags : int
+        Flag header Framed Layout yang menandai isi payload.
 
     Returns
     -------
-    self : bool
-        True jika bilangan adalah bilangan prima. False jika bukan.
+    image : NumPy array
+        Array gambar yang sama setelah pesan disematkan.
     """
-    if num <= 1:
-        return False
-    elif num <= 3:
-        return True
-    
-    def fermat_test(rand_num):
-        """Fermat Test
+    if codec != "none" and not framed:
+        raise ValueError("Kompresi hanya tersedia pada Framed Layout.")
+    if framed:
+        message, text_flags = frame_payload(message)
+        flags |= text_flags
+    else:
+        message = to_payload(message)
 
-        Parameters
-        ----------
-        rand_num : int
-            Bilangan bulat random
-        
-        Returns
-        -------
-        self : bool
-            True jika hasil uji berhasil dan False jika gagal.
-        """
-        if pow(rand_num, num - 1, num) != 1:
-            return False
-        return True
-    
-    for i in range(num_tests):
-        rand_num = random.randint(2, num - 2)
-        if not fermat_test(rand_num):
-            return False
-    return True
+    start_time = time.perf_counter()
+    payload = compress_payload(message, codec, level)
+    compress_time = time.perf_counter() - start_time
+    check_capacity(image.shape, len(payload), bits, framed)
 
-def generate_prime(min_bit, max_bit):
-    """Generate prime value
+    start_time = time.perf_counter()
+    if framed:
+        write_frame(image, payload, bits, CODECS[codec], flags)
+    else:
+        fields = to_bits(payload, bits)
+        if len(fields):
+            row_req = rows_required(image.shape, len(fields))
+            write_slots(image[:row_req], fields, bits)
+
+    if stats is not None:
+        stats.update(compression_stats(
+            codec, len(message), len(payload), bits,
+            compress_time, time.perf_counter() - start_time
+        ))
+    return image
 
-    Menghasilkan bilangan prima antara panjang bit minimum dan maksimum.
+def rows_required(shape, slot_count):
+    """Hitung jumlah baris yang dibutuhkan oleh sejumlah slot
 
     Parameters
     ----------
-    min_bit : int
-        Panjang bit minimum.
+    shape : tuple
+        Bentuk array gambar `(height, width, channels)`.
 
-    max_bit : int
-        Panjang bit maksimum.
+    slot_count : int
+        Jumlah slot (karakter) yang akan ditulis.
 
     Returns
     -------
-    self : int
-        Bilangan prima dengan antara panjang bit minimum dan maksimum.
+    row_req : int
+        Jumlah baris dari atas gambar yang akan tersentuh.
     """
-    while True:
-        candidate = random.getrandbits(random.randint(min_bit, max_bit))
-        if candidate % 2 == 0:
-            candidate += 1
-        if prime_fermat(candidate):
-            return candidate
-
-def generate_pqr(min_bit, max_bit):
-    """Generate prime (p) and random number (q and r)
+    height, width = shape[0], shape[1]
+    per_row = width // 3
+    row_req = math.ceil(slot_count / per_row) if per_row else height + 1
+    if row_req > height:
+        raise ValueError(
+            f"Pesan terlalu panjang: butuh {row_req} baris, gambar hanya {height} baris."
+        )
+    return row_req
 
-    Menghasilkan bilangan prima acak untuk p, q, dan r, dengan p < q * r.
+def write_slots(block, fields, bits= 1):
+    """Tulis nilai slot ke blok baris gambar
 
     Parameters
     ----------
-    min_bit : int
-        Panjang bit minimum untuk p (bilangan prima).
-    
-    max_bit : int
-        Panjang bit maksimum untuk p (bilangan prima).
+    block : NumPy array
+        Potongan baris gambar (boleh berupa memmap). Slot pertama dari `fields`
+        ditulis ke slot pertama baris teratas blok.
 
-    Returns
-    -------
-    self : tuple
-        Menghasilkan nilai tuple untuk p (bilangan prima), q, dan r
-        (bilangan acak).
+    fields : NumPy array
+        Array nilai slot berukuran `(n, 9)` dari `to_bits`.
+
+    bits : int
+        Jumlah bit per kanal (1 - 4).
     """
-    p = generate_prime(min_bit, max_bit)
-    q = random.getrandbits(random.randint(min_bit, max_bit))
-    r = random.getrandbits(random.randint(min_bit, max_bit))
+    write_channels(block, fields.reshape(-1), bits)
 
-    while p >= q * r:
-        p = generate_prime(min_bit, max_bit)
-        q = random.getrandbits(random.randint(min_bit, max_bit))
-        r = random.getrandbits(random.randint(min_bit, max_bit))
-    return p, q, r
+def write_channels(block, fields, bits= 1, offset= 0):
+    """Tulis nilai k bit ke aliran kanal blok baris gambar
 
-def expand_euclidean(a, b):
-    """Euclidean expansion
+    Aliran kanal adalah kanal-kanal slot yang dibaca baris demi baris
+    (`width // 3 * 9` kanal per baris).
 
-    Perluasan dari algoritma Euclidean untuk menemukan pembagi persekutuan
-    terbesar (PBB) dari dua bilangan bulat. Ini juga untuk menemukan dua
-    bilangan bulat yang memenuhi persamaan `ax + by = PBB(a, b)`.
-    
     Parameters
     ----------
-    a : int
-        Bilangan bulat pertama.
+    block : NumPy array
+        Potongan baris gambar (boleh berupa memmap).
 
-    b : int
-        Bilangan bulat kedua.
+    fields : NumPy array
+        Array satu dimensi berisi nilai k bit untuk setiap kanal.
 
-    Returns:
-    X1 : int
-        Nilai koefisien X1 yang merupakan invers modular bilangan bulat
-        pertama terhadap bilangan bulat kedua. Hal ini dibuktikan dengan
-        persamaan `ax + by = PBB(a, b)`.
+    bits : int
+        Jumlah bit per kanal (1 - 4).
+
+    offset : int
+        Indeks kanal pertama pada blok yang akan ditulis.
     """
-    D1, D2 = a, b
-    X1, X2 = 1, 0
-    Y1, Y2 = 0, 1
+    per_row = block.shape[1] // 3
+    row_req = math.ceil((offset + len(fields)) / (per_row * 9))
+
+    region = block[:row_req, :per_row * 3]
+    channels = region.reshape(-1)
+    target = channels[offset:offset + len(fields)]
+    if bits == 1:
+        target -= (target & 1) ^ fields
+    else:
+        target &= np.uint8(0xFF ^ ((1 << bits) - 1))
+        target |= fields
 
-    while D2 > 0:
-        K = D1 // D2
-        D3 = D1 - K * D2
-        D1 = D2
-        D2 = D3
-        
-        X3 = X1 - K * X2
-        X1 = X2
-        X2 = X3
+    if not np.shares_memory(channels, block):
+        block[:row_req, :per_row * 3] = channels.reshape(region.shape)
 
-        Y3 = Y1 - K * Y2
-        Y1 = Y2
-        Y2 = Y3
-    return X1
+def read_channels(image, offset, count, bits= 1, max_rows= None):
+    """Baca nilai k bit dari aliran kanal gambar
 
-def inverse_modular(num, mod):
-    """Calculate of Inverse Modular
+    Hanya baris yang memuat kanal `offset` sampai `offset + count` yang
+    dibaca, per blok berisi paling banyak `max_rows` baris.
 
-    Mencari invers modular dari bilangan bulat terhadap nilai modulus.
-    Invers modular digunakan untuk melakukan perkalian modular.
+    Returns
+    -------
+    fields : NumPy array
+        Array uint8 satu dimensi sepanjang `count`.
+    """
+    per_row = image.shape[1] // 3
+    first = offset // (per_row * 9)
+    last = math.ceil((offset + count) / (per_row * 9))
+    if not count:
+        return np.zeros(0, dtype= np.uint8)
+
+    mask, step = (1 << bits) - 1, max_rows or last - first
+    parts = [
+        (image[start:min(start + step, last), :per_row * 3] & mask).reshape(-1)
+        for start in range(first, last, step)
+    ]
+    channels = parts[0] if len(parts) == 1 else np.concatenate(parts)
+    skip = offset - first * per_row * 9
+    return channels[skip:skip + count]
+
+def read_slots(fields, bits= 1):
+    """Ubah nilai slot menjadi aliran bit `(n, 9k)`"""
+    if bits == 1:
+        return fields
+    stream = np.unpackbits(fields[:, :, None], axis= 2)[:, :, 8 - bits:]
+    return stream.reshape(len(fields), 9 * bits)
+
+@METRICS.timed("extract")
+def extract_array(image, chunk_rows= 64, max_rows= None, bits= 1, legacy= True):
+    """Ekstrak pesan dari array gambar
+
+    Header Framed Layout diperiksa terlebih dahulu. Jika ditemukan, payload
+    dibaca tepat sepanjang yang tercatat di header. Jika tidak, gambar dibaca
+    dengan tata letak legacy atau langsung ditolak.
+
+    Versi vektor dari ekstraksi LSB. Bidang LSB diambil per blok baris dengan
+    operasi array, bit penanda berhenti pertama dicari secara vektor, dan bit
+    data diubah menjadi byte dengan `np.packbits`. Ukuran blok berlipat dua
+    setiap kali penanda belum ditemukan sehingga biaya ekstraksi mengikuti
+    panjang pesan, bukan ukuran gambar.
 
     Parameters
     ----------
-    num : int
-        Bilangan yang ingin dicari invers modular.
-    
-    mod : int
-        Bilangan modulusnya.
+    image : NumPy array
+        Array gambar BGR uint8 yang memiliki pesan disematkan.
+
+    chunk_rows : int
+        Jumlah baris pada blok pertama yang dipindai.
+
+    max_rows : int or None
+        Batas atas jumlah baris per blok. None berarti tanpa batas.
+
+    bits : int
+        Jumlah bit per kanal (1 - 4) untuk tata letak legacy. Framed Layout
+        membaca nilai ini dari header.
+
+    legacy : bool
+        Baca gambar tanpa header dengan tata letak legacy jika True, atau
+        tolak dengan ValueError jika False.
 
     Returns
     -------
-    inv : int or None
-        Invers modular bilangan bulat terhadap modulus (dalam batasan
-        0 <= invers <= modulus). None jika invers tidak ditemukan
-        (misalnya bilangan bulat dan modulus tidak coprime atau
-        bilangan prima).
+    self : str
+        Pesan yang berhasil diekstrak dari gambar.
     """
-    inv = None
-    while inv is None:
-        temp = expand_euclidean(num, mod)
+    frame = read_frame(image, max_rows)
+    if frame is not None:
+        header, payload = frame
+        if header["flags"] & FRAME_SHARD:
+            raise ValueError("Gambar berisi satu bagian pesan, baca bersama bagian lainnya dengan `read_shards`.")
+        if header["flags"] & FRAME_CHIPERTEXT:
+            raise ValueError("Gambar berisi chipertext, baca bersama kunci dengan `read_secret`.")
+        if header["flags"] & FRAME_VIDEO:
+            raise ValueError("Gambar adalah frame video, baca videonya dengan `read_video`.")
+        return frame_text(decompress_payload(payload, header["codec"]), header["flags"])
+    if not legacy:
+        raise ValueError("Gambar tidak mengandung pesan.")
+
+    capacity(image.shape, bits)
+    height, width, _ = image.shape
+    per_row = width // 3
+    mask = (1 << bits) - 1
+    if max_rows is not None:
+        chunk_rows = min(chunk_rows, max_rows)
+
+    data, start = [], 0
+    while start < height and per_row:
+        finish = min(start + chunk_rows, height)
+        fields = (image[start:finish, :per_row * 3] & mask).reshape(-1, 9)
+
+        stop = (fields[:, 8] & 1).argmax()
+        if fields[stop, 8] & 1:
+            stream = read_slots(fields[:stop + 1], bits)
+            chunk = np.packbits(stream[:, :8 * bits], axis= 1).tobytes()
+            if bits > 1:
+                valid = int(np.packbits(stream[-1, 8 * bits:-1])[0]) >> (9 - bits)
+                chunk = chunk[:stop * bits + valid + 1]
+            data.append(chunk)
+            break
+        stream = read_slots(fields, bits)
+        data.append(np.packbits(stream[:, :8 * bits], axis= 1).tobytes())
 
-        if temp < 0:
-            temp += mod
-        if num * temp % mod == 1 and 0 <= temp <= mod:
-            inv = temp
-    return inv
+        start, chunk_rows = finish, chunk_rows * 2
+        if max_rows is not None:
+            chunk_rows = min(chunk_rows, max_rows)
 
-def generate_keys():
-    """Generate keys
-    
-    Menghasilkan kunci kriptografi Vincent-Sathiyamoorthy RSA.
+    return b"".join(data).decode("latin-1")
+
+"""Framed Layout
+
+Tata letak default penyematan. 128 kanal pertama dari aliran kanal menyimpan
+header 16 byte pada 1 LSB: magic, versi, bit per kanal, codec, flag, panjang
+payload, dan CRC32 payload. Payload menyusul secara rapat dengan k bit per
+kanal mulai kanal ke-128. Gambar tanpa magic ditolak setelah membaca 43 piksel
+pertama, dan payload dibaca tepat sepanjang yang tercatat di header. Pesan teks
+disimpan sebagai UTF-8 dengan flag `FRAME_UTF8`; tata letak legacy tetap
+memakai Latin-1.
+"""
+
+FRAME_MAGIC = b"VSFR"
+FRAME_VERSION = 1
+FRAME_HEADER = struct.Struct(">4sBBBBII")
+FRAME_CHANNELS = FRAME_HEADER.size * 8
+
+## bit pada byte flag header
+FRAME_SHARD = 0x01
+FRAME_CHIPERTEXT = 0x02
+FRAME_VIDEO = 0x04
+FRAME_UTF8 = 0x08
+
+def frame_payload(message):
+    """Ubah pesan menjadi payload Framed Layout
+
+    Teks dikodekan sebagai UTF-8 dan ditandai flag `FRAME_UTF8`, sedangkan
+    bytes disimpan apa adanya.
 
     Returns
     -------
     self : tuple
-        Berisi bilangan prima (p), bilangan acak (q dan r), kombinasi bilangan
-        prima yang dhitung dengan `(q * r) - p` (s), ekponen publik untuk
-        enkripsi pesan (e), nilai kombinasi untuk perhitungan eksponen privat
-        dihitung dengan `(pow(p, 2) * s) + q` (t), modulus kunci untuk enkripsi
-        dan dekripsi pesan (n), inverse modular dari p modulo n (u), dan
-        eksponen privat untuk dekripsi pesan yang dihitung menggunakan invers
-        modular u dari p modulo n (d)
+        `(payload, flags)`.
     """
-    min_bit = 1024
-    max_bit = 2048
+    if isinstance(message, str):
+        return message.encode("utf-8"), FRAME_UTF8
+    return bytes(message), 0
+
+def frame_text(payload, flags):
+    """Dekode payload teks sesuai flag header (Latin-1 tanpa `FRAME_UTF8`)"""
+    return payload.decode("utf-8" if flags & FRAME_UTF8 else "latin-1")
+
+def to_fields(data, bits= 1):
+    """Pecah bytes menjadi nilai k bit per kanal (MSB terlebih dahulu)"""
+    stream = np.unpackbits(np.frombuffer(data, dtype= np.uint8))
+    if len(stream) % bits:
+        stream = np.concatenate([stream, np.zeros(-len(stream) % bits, dtype= np.uint8)])
+    if bits == 1:
+        return stream
+    return np.packbits(stream.reshape(-1, bits), axis= 1)[:, 0] >> (8 - bits)
+
+def from_fields(fields, size, bits= 1):
+    """Gabungkan nilai k bit per kanal menjadi `size` byte"""
+    if bits > 1:
+        fields = np.unpackbits(fields[:, None], axis= 1)[:, 8 - bits:].reshape(-1)
+    return np.packbits(fields[:size * 8]).tobytes()
+
+def write_frame(image, payload, bits= 1, codec= 0, flags= 0, max_rows= None):
+    """Tulis header dan payload Framed Layout
 
-    p, q, r = generate_pqr(min_bit, max_bit)
-    s = (q * r) - p
-    e = (p * s) + r
-    t = (pow(p, 2) * s) + q
-    n = ((e * t) - p) // s
-    u = inverse_modular(p, n)
-    d = u * t
+    Parameters
+    ----------
+    image : NumPy array
+        Array gambar BGR uint8 (boleh berupa memmap) yang diubah secara langsung.
 
-    return p, q, r, s, e, t, n, u, d
+    payload : bytes
+        Data yang akan disematkan. Kapasitas harus sudah diperiksa.
 
-def read_key(filepath):
-    """Read keys
+    bits : int
+        Jumlah bit per kanal (1 - 4) untuk payload.
+
+    codec, flags : int
+        Nilai yang dicatat di header untuk tahap pengolahan payload.
+
+    max_rows : int or None
+        Batas jumlah baris per blok penulisan. None berarti sekaligus.
+    """
+    header = FRAME_HEADER.pack(
+        FRAME_MAGIC, FRAME_VERSION, bits, codec, flags, len(payload), zlib.crc32(payload)
+    )
+    write_channels(image, to_fields(header))
+
+    fields = to_fields(payload, bits)
+    width = image.shape[1] // 3 * 9
+    finish = FRAME_CHANNELS + len(fields)
+    row_req = math.ceil(finish / width)
+    step = max_rows or row_req
+
+    for start in range(FRAME_CHANNELS // width, row_req, step):
+        low = max(start * width, FRAME_CHANNELS)
+        high = min((start + step) * width, finish)
+        if low < high:
+            write_channels(
+                image[start:start + step], fields[low - FRAME_CHANNELS:high - FRAME_CHANNELS],
+                bits, low - start * width
+            )
 
-    Membaca kunci kriptografi Vincent-Sathiyamoorthy RSA dari file docx.
+def read_frame(image, max_rows= None):
+    """Baca header dan payload Framed Layout
 
     Parameters
     ----------
-    filepath : str
-        Jalur direktori dari file yang akan di olah.
-    
+    image : NumPy array
+        Array gambar BGR uint8 (boleh berupa memmap).
+
+    max_rows : int or None
+        Batas jumlah baris per blok pembacaan. None berarti sekaligus.
+
     Returns
     -------
-    self : tuple
-        Kunci-kunci yang dimiliki, terdiri dari p, q, r, s, e, t, n, u, d.
-
-    Lebih lanjut `Generate Keys Vincent-Sathiyamoorthy RSA`.
+    self : tuple or None
+        `(header, payload)` dengan header berupa dict berisi `version`, `bits`,
+        `codec`, `flags`, dan `length`. None jika gambar tidak memiliki header.
     """
-    text = get_docx(filepath)
-    keys = [int(Decimal(x.group())) for x in re.finditer(r"\d+", text)]
-    p, q, r, s, e, t, n, u, d = keys[0], keys[1], keys[2], keys[3], \
-        keys[4], keys[5], keys[6], keys[7], keys[8]
-    return p, q, r, s, e, t, n, u, d
\ No newline at end of file
+    if image.shape[0] * (image.shape[1] // 3) * 9 < FRAME_CHANNELS:
+        return None
+
+    head = from_fields(read_channels(image, 0, FRAME_CHANNELS), FRAME_HEADER.size)
+    magic, version, bits, codec, flags, length, checksum = FRAME_HEADER.unpack(head)
+    if magic != FRAME_MAGIC:
+        return None
+    if version != FRAME_VERSION:
+        raise ValueError(f"Versi pesan {version} tidak didukung.")
+    if not 1 <= bits <= 4 or length > capacity(image.shape, bits):
+        raise ValueError("Header pesan rusak.")
+
+    fields = read_channels(
+        image, FRAME_CHANNELS, math.ceil(length * 8 / bits), bits, max_rows
+    )
+    payload = from_fields(fields, length, bits)
+    if zlib.crc32(payload) != checksum:
+        raise ValueError("Checksum pesan tidak cocok, gambar rusak atau telah diubah.")
+
+    header = {
+        "version": version, "bits": bits, "codec": codec,
+        "flags": flags, "length": length
+    }
+    return header, payload
+
+"""Payload Compression
+
+Tahap opsional sebelum penyematan. Pesan berupa log atau JSON biasanya sangat
+redundan sehingga payload terkompresi menyentuh jauh lebih sedikit piksel.
+Codec dicatat pada header Framed Layout dan pembacaan mendekompresi payload
+secara otomatis.
+"""
+
+CODECS = {"none": 0, "zlib": 1, "lzma": 2}
+
+def compress_payload(payload, codec= "none", level= None):
+    """Kompresi payload
+
+    Parameters
+    ----------
+    payload : bytes
+        Data yang akan dikompresi.
+
+    codec : str
+        "none", "zlib", atau "lzma".
+
+    level : int or None
+        Tingkat kompresi 0 - 9. None berarti default codec (6).
+
+    Returns
+    -------
+    self : bytes
+        Payload hasil kompresi.
+    """
+    if codec not in CODECS:
+        raise ValueError(f"Codec '{codec}' tidak dikenal, pilih salah satu dari {list(CODECS)}.")
+    if level is not None and not 0 <= level <= 9:
+        raise ValueError("Tingkat kompresi harus antara 0 dan 9.")
+    if codec == "none":
+        return payload
+
+    level = 6 if level is None else level
+    with METRICS.stage(f"compress_{codec}"):
+        if codec == "zlib":
+            return zlib.compress(payload, level)
+        return lzma.compress(payload, preset= level)
+
+def decompress_payload(payload, codec_id):
+    """Dekompresi payload sesuai codec yang tercatat di header
+
+    Parameters
+    ----------
+    payload : bytes
+        Payload hasil ekstraksi.
+
+    codec_id : int
+        Nilai codec pada header (lihat `CODECS`).
+
+    Returns
+    -------
+    self : bytes
+        Payload asli.
+    """
+    if codec_id == CODECS["none"]:
+        return payload
+
+    codec = {id: name for name, id in CODECS.items()}.get(codec_id)
+    if codec is None:
+        raise ValueError(f"Codec {codec_id} pada header tidak dikenal.")
+    try:
+        with METRICS.stage(f"decompress_{codec}"):
+            if codec == "zlib":
+                return zlib.decompress(payload)
+            return lzma.decompress(payload)
+    except (zlib.error, lzma.LZMAError):
+        raise ValueError("Payload terkompresi rusak.")
+
+def compression_stats(codec, original, stored, bits, compress_seconds, embed_seconds):
+    """Ringkasan rasio kompresi dan estimasi waktu yang dihemat
+
+    Waktu yang dihemat diperkirakan dari waktu penulisan per byte payload
+    dikalikan jumlah byte yang tidak perlu ditulis, dikurangi waktu kompresi.
+    Nilai negatif berarti kompresi lebih mahal daripada piksel yang dihemat.
+
+    Returns
+    -------
+    self : dict
+        `codec`, `original` dan `stored` (byte), `ratio`, `pixels_saved`,
+        `compress_seconds`, `embed_seconds`, dan `saved_seconds`.
+    """
+    per_byte = embed_seconds / max(stored, 1)
+    if codec != "none":
+        METRICS.count("compress_saved_bytes", original - stored)
+    return {
+        "codec": codec, "original": original, "stored": stored,
+        "ratio": original / max(stored, 1),
+        "pixels_saved": (original - stored) * 8 // (bits * 3),
+        "compress_seconds": compress_seconds, "embed_seconds": embed_seconds,
+        "saved_seconds": per_byte * (original - stored) - compress_seconds
+    }
+
+"""Out-of-core Mode
+
+Fungsi-fungsi untuk gambar berukuran sangat besar. Piksel disimpan sebagai
+buffer mentah `.npy` yang dibuka dengan memory-map, sehingga penyematan dan
+ekstraksi hanya menyentuh baris yang dibutuhkan pesan dan diproses per potongan
+baris dengan batas memori tertentu.
+
+Parameters
+----------
+max_memory : int
+    Batas memori (dalam byte) untuk satu potongan baris yang diproses.
+"""
+
+MEMMAP_LIMIT = 64 * 1024 ** 2
+
+def tile_rows(shape, max_memory= MEMMAP_LIMIT):
+    """Jumlah baris per potongan agar tidak melebihi `max_memory`"""
+    row_bytes = shape[1] * shape[2]
+    return max(1, max_memory // (row_bytes * 2))
+
+def image_to_memmap(filepath, dst):
+    """Konversi gambar ke buffer mentah `.npy`
+
+    Dekode gambar dilakukan satu kali. Setelah itu, semua penyematan dan
+    ekstraksi dapat berjalan langsung pada buffer tanpa memuat seluruh gambar.
+
+    Parameters
+    ----------
+    filepath : str
+        Jalur file gambar sumber.
+
+    dst : str
+        Jalur file `.npy` tujuan.
+
+    Returns
+    -------
+    self : tuple
+        Bentuk array gambar `(height, width, channels)`.
+    """
+    image = cv2.imread(filepath)
+    buffer = np.lib.format.open_memmap(
+        dst, mode= "w+", dtype= np.uint8, shape= image.shape
+    )
+    buffer[:] = image
+    buffer.flush()
+    return image.shape
+
+def memmap_to_image(filepath, dst):
+    """Simpan buffer `.npy` sebagai file gambar (misal PNG)"""
+    buffer = np.load(filepath, mmap_mode= "r")
+    cv2.imwrite(dst, buffer)
+
+def embed_memmap(filepath, message: str, dst= None, max_memory= MEMMAP_LIMIT, bits= 1, framed= True, codec= "none", level= None):
+    """Sematkan pesan ke buffer `.npy` secara out-of-core
+
+    Parameters
+    ----------
+    filepath : str
+        Jalur buffer `.npy` dari `image_to_memmap`.
+
+    message : str
+        Pesan yang akan disematkan.
+
+    dst : str or None
+        Jika diisi, buffer disalin terlebih dahulu ke jalur ini dan pesan
+        disematkan ke salinan. Jika None, buffer diubah secara langsung.
+
+    max_memory : int
+        Batas memori (dalam byte) untuk satu potongan baris.
+
+    bits : int
+        Jumlah bit per kanal (1 - 4).
+
+    framed : bool
+        Gunakan Framed Layout jika True, atau tata letak legacy jika False.
+
+    codec, level : str, int or None
+        Kompresi payload (lihat `compress_payload`). Hanya untuk Framed Layout.
+    """
+    if codec != "none" and not framed:
+        raise ValueError("Kompresi hanya tersedia pada Framed Layout.")
+    if framed:
+        message, flags = frame_payload(message)
+    else:
+        message = to_payload(message)
+
+    message = compress_payload(message, codec, level)
+    buffer = np.load(filepath, mmap_mode= "r")
+    check_capacity(buffer.shape, len(message), bits, framed)
+
+    if dst is not None:
+        shutil.copyfile(filepath, dst)
+        filepath = dst
+
+    buffer = np.load(filepath, mmap_mode= "r+")
+    step = tile_rows(buffer.shape, max_memory)
+    if framed:
+        write_frame(buffer, message, bits, CODECS[codec], flags, max_rows= step)
+        buffer.flush()
+        return
+
+    fields = to_bits(message, bits)
+    if not len(fields):
+        return
+
+    row_req = rows_required(buffer.shape, len(fields))
+    per_row = buffer.shape[1] // 3
+
+    for start in range(0, row_req, step):
+        finish = min(start + step, row_req)
+        write_slots(
+            buffer[start:finish], fields[start * per_row:finish * per_row], bits
+        )
+    buffer.flush()
+
+def read_memmap(filepath, max_memory= MEMMAP_LIMIT, bits= 1, legacy= True):
+    """Ekstrak pesan dari buffer `.npy` secara out-of-core
+
+    Parameters
+    ----------
+    filepath : str
+        Jalur buffer `.npy` yang memiliki pesan disematkan.
+
+    max_memory : int
+        Batas memori (dalam byte) untuk satu potongan baris.
+
+    bits : int
+        Jumlah bit per kanal (1 - 4) untuk tata letak legacy.
+
+    legacy : bool
+        Baca buffer tanpa header dengan tata letak legacy jika True.
+
+    Returns
+    -------
+    self : str
+        Pesan yang berhasil diekstrak.
+    """
+    buffer = np.load(filepath, mmap_mode= "r")
+    return extract_array(
+        buffer, max_rows= tile_rows(buffer.shape, max_memory), bits= bits, legacy= legacy
+    )
+
+def embed_msg(filepath: str, message: str, output= "./data/images/steno_result.png", bits= 1, framed= True, codec= "none", level= None, stats= None):
+    """Image based Steganography using Least Significant Bit
+
+    Menyematkan pesan dalam gambar dengan teknik LSB (Least Significant Bit)
+    dengan memanipulasi bit-bit piksel gambar tanpa mengubah tampilan visual
+    secara signifikan.
+
+    Parameters
+    ----------
+    filepath : str
+        Jalur file gambar yang akan diolah.
+    
+    message : str
+        Pesan yang akan disematkan ke dalam gambar.
+
+    output : str
+        Jalur file PNG hasil penyematan.
+
+    bits : int
+        Jumlah bit per kanal (1 - 4).
+
+    framed : bool
+        Gunakan Framed Layout jika True, atau tata letak legacy jika False.
+
+    codec, level, stats : str, int or None, dict or None
+        Kompresi payload dan ringkasannya (lihat `embed_array`).
+
+    Returns
+    -------
+    image : NumPy array
+        Mengembalikkan NumPy array yang mengandung nilai piksel dari gambar
+        dalam format BGR (blue-green-red).
+    """
+    with METRICS.stage("image_decode"):
+        image = cv2.imread(filepath)
+    embed_array(image, message, bits, framed, codec, level, stats)
+
+    mk_dir(os.path.dirname(output) or ".")
+    with METRICS.stage("image_encode"):
+        cv2.imwrite(output, image)
+    return image[:, :, ::-1]
+
+def read_msg(filepath: str, bits= 1, legacy= True):
+    """Extract hidden message
+
+    Baca pesan yang disembunyikan dalam suatu gambar dengan ekstraksi teknik LSB.
+
+    Parameters
+    ----------
+    filepath : str
+        Jalur gambar yang memiliki pesan disematkan.
+
+    bits : int
+        Jumlah bit per kanal (1 - 4) untuk tata letak legacy.
+
+    legacy : bool
+        Baca gambar tanpa header dengan tata letak legacy jika True, atau
+        tolak dengan ValueError jika False.
+
+    Returns
+    -------
+    self : str
+        Pesan yang berhasil diekstrak dari gambar.
+    """
+    with METRICS.stage("image_decode"):
+        image = cv2.imread(filepath)
+    return extract_array(image, bits= bits, legacy= legacy)
+
+"""In-memory Pipeline
+
+Varian `embed_msg` dan `read_msg` yang bekerja langsung pada buffer hasil
+unggahan, tanpa file sementara maupun file hasil di disk.
+"""
+
+@METRICS.timed("image_decode")
+def decode_image(buffer):
+    """Dekode gambar dari buffer
+
+    Parameters
+    ----------
+    buffer : bytes-like or NumPy array
+        Isi file gambar (PNG, JPG, ...) atau array gambar BGR. Array akan
+        disalin agar data pemanggil tidak berubah.
+
+    Returns
+    -------
+    image : NumPy array
+        Array gambar BGR uint8.
+    """
+    if isinstance(buffer, np.ndarray):
+        return buffer.copy()
+
+    image = cv2.imdecode(np.frombuffer(buffer, dtype= np.uint8), cv2.IMREAD_COLOR)
+    if image is None:
+        raise ValueError("Gambar tidak dapat dibaca.")
+    return image
+
+@METRICS.timed("image_encode")
+def encode_image(image, ext= ".png"):
+    """Enkode array gambar BGR menjadi bytes file gambar"""
+    success, buffer = cv2.imencode(ext, image)
+    if not success:
+        raise ValueError(f"Gambar tidak dapat disimpan sebagai {ext}.")
+    return buffer.tobytes()
+
+PREVIEW_MAX_SIDE = 640
+
+@METRICS.timed("preview")
+def preview_image(buffer, max_side= PREVIEW_MAX_SIDE, quality= 85):
+    """Buat thumbnail kecil untuk ditampilkan
+
+    Sisi terpanjang gambar dibatasi `max_side` piksel dan hasilnya dikodekan
+    sebagai JPEG, sehingga data yang dikirim ke browser tetap kecil berapa
+    pun resolusi gambar aslinya. Thumbnail hanya untuk tampilan, bukan untuk
+    dibaca pesannya.
+
+    Parameters
+    ----------
+    buffer : bytes-like or NumPy array
+        Isi file gambar atau array gambar BGR (tidak diubah).
+
+    max_side : int
+        Panjang maksimum sisi terpanjang thumbnail (dalam piksel).
+
+    quality : int
+        Kualitas JPEG (0 - 100).
+
+    Returns
+    -------
+    self : bytes
+        Isi file JPEG thumbnail.
+    """
+    image = buffer if isinstance(buffer, np.ndarray) else decode_image(buffer)
+
+    height, width = image.shape[:2]
+    scale = max_side / max(height, width)
+    if scale < 1:
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        image = cv2.resize(image, size, interpolation= cv2.INTER_AREA)
+
+    success, data = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not success:
+        raise ValueError("Thumbnail tidak dapat dibuat.")
+    return data.tobytes()
+
+def embed_buffer(buffer, message: str, bits= 1, framed= True, codec= "none", level= None, stats= None):
+    """Sematkan pesan ke gambar di memori
+
+    Parameters
+    ----------
+    buffer : bytes-like or NumPy array
+        Isi file gambar atau array gambar BGR.
+
+    message : str
+        Pesan yang akan disematkan ke dalam gambar.
+
+    bits : int
+        Jumlah bit per kanal (1 - 4).
+
+    framed : bool
+        Gunakan Framed Layout jika True, atau tata letak legacy jika False.
+
+    codec, level, stats : str, int or None, dict or None
+        Kompresi payload dan ringkasannya (lihat `embed_array`).
+
+    Returns
+    -------
+    self : bytes
+        Isi file PNG hasil penyematan.
+    """
+    image = decode_image(buffer)
+    embed_array(image, message, bits, framed, codec, level, stats)
+    return encode_image(image)
+
+def read_buffer(buffer, bits= 1, legacy= True):
+    """Ekstrak pesan dari gambar di memori
+
+    Parameters
+    ----------
+    buffer : bytes-like or NumPy array
+        Isi file gambar atau array gambar BGR.
+
+    bits : int
+        Jumlah bit per kanal (1 - 4) untuk tata letak legacy.
+
+    legacy : bool
+        Baca gambar tanpa header dengan tata letak legacy jika True, atau
+        tolak dengan ValueError jika False.
+
+    Returns
+    -------
+    self : str
+        Pesan yang berhasil diekstrak dari gambar.
+    """
+    if isinstance(buffer, np.ndarray):
+        return extract_array(buffer, bits= bits, legacy= legacy)
+    return extract_array(decode_image(buffer), bits= bits, legacy= legacy)
+
+"""Sharded Mode
+
+Satu payload dibagi rata ke N gambar sampul sehingga ukuran pesan tidak
+dibatasi kapasitas satu gambar. Setiap bagian (shard) adalah Framed Layout
+dengan flag `FRAME_SHARD` dan header urutan di awal payload: id set (16 byte
+pertama SHA-256 payload utuh), indeks, dan jumlah shard. Penyematan dan
+ekstraksi setiap shard berjalan paralel, lalu shard disusun ulang sesuai
+indeks dan diverifikasi dengan id set.
+"""
+
+SHARD_HEADER = struct.Struct(">16sHH")
+
+def map_shards(func, args, workers= 1):
+    """Jalankan `func` untuk setiap argumen, paralel jika `workers` > 1
+
+    Urutan hasil mengikuti urutan `args`.
+    """
+    if workers <= 1 or len(args) <= 1:
+        return [func(*arg) for arg in args]
+    with ProcessPoolExecutor(max_workers= min(workers, len(args))) as pool:
+        return list(pool.map(func, *zip(*args)))
+
+def embed_shard(buffer, shard, bits= 1, codec_id= 0, flags= FRAME_SHARD):
+    """Sematkan satu shard ke gambar dan kembalikan bytes PNG"""
+    image = decode_image(buffer)
+    check_capacity(image.shape, len(shard), bits)
+    write_frame(image, shard, bits, codec_id, flags)
+    return encode_image(image)
+
+def read_shard(buffer):
+    """Baca header dan payload satu shard"""
+    image = buffer if isinstance(buffer, np.ndarray) else decode_image(buffer)
+    frame = read_frame(image)
+    if frame is None or not frame[0]["flags"] & FRAME_SHARD:
+        raise ValueError("Gambar bukan bagian dari pesan ber-shard.")
+    return frame
+
+@METRICS.timed("embed_sharded")
+def embed_shards(buffers, message, bits= 1, codec= "none", level= None, workers= 1, stats= None):
+    """Sematkan satu pesan ke beberapa gambar sampul
+
+    Parameters
+    ----------
+    buffers : list
+        Isi file gambar atau array gambar BGR untuk setiap sampul. Pesan
+        dibagi rata sehingga sampul sebaiknya berkapasitas serupa.
+
+    message : str or bytes
+        Pesan yang akan disematkan.
+
+    bits : int
+        Jumlah bit per kanal (1 - 4).
+
+    codec, level : str, int or None
+        Kompresi payload utuh sebelum dibagi (lihat `compress_payload`).
+
+    workers : int
+        Jumlah proses paralel.
+
+    stats : dict or None
+        Jika diisi, diperbarui dengan ringkasan `compression_stats`.
+
+    Returns
+    -------
+    self : list
+        Bytes PNG hasil penyematan sesuai urutan `buffers`.
+    """
+    count = len(buffers)
+    if not 1 <= count <= 0xFFFF:
+        raise ValueError("Jumlah gambar sampul harus antara 1 dan 65535.")
+
+    message, flags = frame_payload(message)
+    start_time = time.perf_counter()
+    payload = compress_payload(message, codec, level)
+    compress_time = time.perf_counter() - start_time
+
+    set_id = hashlib.sha256(payload).digest()[:16]
+    size = math.ceil(len(payload) / count)
+    shards = [
+        SHARD_HEADER.pack(set_id, index, count) + payload[index * size:(index + 1) * size]
+        for index in range(count)
+    ]
+
+    start_time = time.perf_counter()
+    images = map_shards(
+        embed_shard, [
+            (buffer, shard, bits, CODECS[codec], FRAME_SHARD | flags)
+            for buffer, shard in zip(buffers, shards)
+        ],
+        workers
+    )
+    if stats is not None:
+        stats.update(compression_stats(
+            codec, len(message), len(payload), bits,
+            compress_time, time.perf_counter() - start_time
+        ))
+    return images
+
+@METRICS.timed("extract_sharded")
+def read_shards(buffers, workers= 1):
+    """Ekstrak pesan dari seluruh gambar hasil `embed_shards`
+
+    Parameters
+    ----------
+    buffers : list
+        Isi file gambar atau array gambar BGR setiap shard, dalam urutan apa
+        pun.
+
+    workers : int
+        Jumlah proses paralel.
+
+    Returns
+    -------
+    self : str
+        Pesan yang berhasil diekstrak.
+    """
+    frames = map_shards(read_shard, [(buffer,) for buffer in buffers], workers)
+
+    shards, set_ids = {}, set()
+    for header, payload in frames:
+        set_id, index, count = SHARD_HEADER.unpack_from(payload)
+        shards[index] = (set_id, count, header, payload[SHARD_HEADER.size:])
+        set_ids.add(set_id)
+
+    if len(set_ids) != 1:
+        raise ValueError("Gambar berasal dari pesan ber-shard yang berbeda.")
+    count = next(iter(shards.values()))[1]
+    if sorted(shards) != list(range(count)):
+        raise ValueError(f"Shard tidak lengkap: ditemukan {len(shards)} dari {count}.")
+
+    payload = b"".join(shards[index][3] for index in range(count))
+    if hashlib.sha256(payload).digest()[:16] != set_ids.pop():
+        raise ValueError("Payload hasil penyusunan shard tidak cocok.")
+    header = shards[0][2]
+    return frame_text(decompress_payload(payload, header["codec"]), header["flags"])
+
+"""Video Mode
+
+Pesan disematkan ke frame-frame video sehingga ukurannya dapat mencapai
+kapasitas seluruh klip. Payload (setelah kompresi) dibagi menjadi potongan
+sebesar kapasitas satu frame dan setiap potongan menjadi Framed Layout dengan
+flag `FRAME_VIDEO` dan header urutan di awal payload: id pesan (16 byte
+pertama SHA-256 payload utuh), indeks frame, dan jumlah frame berisi pesan.
+Frame sesudahnya disalin tanpa perubahan.
+
+Frame dibaca, disematkan, dan ditulis satu per satu. Penulisan (enkode video)
+berjalan di thread terpisah dengan antrean terbatas, sehingga memori hanya
+menampung beberapa frame berapa pun panjang videonya. Video hasil harus
+memakai codec lossless (default FFV1 dalam `.mkv`) agar LSB tidak berubah.
+"""
+
+VIDEO_HEADER = struct.Struct(">16sII")
+VIDEO_FOURCC = "FFV1"
+VIDEO_QUEUE = 4
+
+def open_video(filepath):
+    """Buka video dengan `cv2.VideoCapture`
+
+    Returns
+    -------
+    self : tuple
+        `(capture, info)` dengan info berupa dict berisi `width`, `height`,
+        `fps`, dan `frames` (0 jika jumlah frame tidak diketahui).
+    """
+    capture = cv2.VideoCapture(filepath)
+    if not capture.isOpened():
+        raise ValueError(f"Video '{filepath}' tidak dapat dibaca.")
+
+    info = {
+        "width": int(capture.get(cv2.CAP_PROP_FRAME_WIDTH)),
+        "height": int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)),
+        "fps": capture.get(cv2.CAP_PROP_FPS) or 25.0,
+        "frames": max(int(capture.get(cv2.CAP_PROP_FRAME_COUNT)), 0)
+    }
+    return capture, info
+
+def video_capacity(info, bits= 1):
+    """Kapasitas video
+
+    Parameters
+    ----------
+    info : dict
+        Informasi video dari `open_video`.
+
+    bits : int
+        Jumlah bit per kanal (1 - 4).
+
+    Returns
+    -------
+    self : tuple
+        `(per_frame, total)` yaitu jumlah byte pesan per frame dan untuk
+        seluruh video (total 0 jika jumlah frame tidak diketahui).
+    """
+    per_frame = capacity((info["height"], info["width"], 3), bits) - VIDEO_HEADER.size
+    if per_frame <= 0:
+        raise ValueError("Frame video terlalu kecil untuk menyimpan pesan.")
+    return per_frame, per_frame * info["frames"]
+
+class FrameWriter():
+    """Tahap penulisan frame video di thread terpisah
+
+    Frame dimasukkan ke antrean berukuran terbatas dan dienkode oleh thread
+    penulis, sehingga enkode frame sebelumnya berjalan bersamaan dengan
+    penyematan frame berikutnya. Jika antrean penuh, `write` menunggu.
+
+    Parameters
+    ----------
+    output_ : str
+        Jalur file video hasil.
+
+    fourcc_ : str
+        Kode 4 karakter codec video (harus lossless).
+
+    fps_ : float
+        Frame per detik.
+
+    size_ : tuple
+        Ukuran frame `(width, height)`.
+
+    queue_ : int
+        Jumlah maksimum frame yang menunggu ditulis.
+    """
+
+    def __init__(self, output_, fourcc_= VIDEO_FOURCC, fps_= 25.0, size_= (0, 0), queue_= VIDEO_QUEUE):
+        self.output_ = output_
+        self.writer_ = cv2.VideoWriter(output_, cv2.VideoWriter_fourcc(*fourcc_), fps_, size_)
+        if not self.writer_.isOpened():
+            raise ValueError(f"Video '{output_}' tidak dapat ditulis dengan codec {fourcc_}.")
+
+        self.queue_ = queue.Queue(maxsize= queue_)
+        self.error_ = None
+        self.thread_ = threading.Thread(target= self._run, daemon= True)
+        self.thread_.start()
+
+    def _run(self):
+        while True:
+            frame = self.queue_.get()
+            if frame is None:
+                break
+            if self.error_ is not None:
+                continue
+            try:
+                with METRICS.stage("video_encode"):
+                    self.writer_.write(frame)
+            except Exception as desc:
+                self.error_ = desc
+
+    def write(self, frame):
+        """Masukkan satu frame ke antrean penulisan"""
+        if self.error_ is not None:
+            raise self.error_
+        self.queue_.put(frame)
+
+    def close(self):
+        """Tunggu semua frame selesai ditulis lalu tutup file video"""
+        self.queue_.put(None)
+        self.thread_.join()
+        self.writer_.release()
+        if self.error_ is not None:
+            raise self.error_
+
+@METRICS.timed("embed_video")
+def embed_video(filepath, message, output= "./data/videos/steno_result.mkv", bits= 1, codec= "none", level= None, stats= None, fourcc= VIDEO_FOURCC):
+    """Sematkan pesan ke frame-frame video
+
+    Parameters
+    ----------
+    filepath : str
+        Jalur file video sumber.
+
+    message : str or bytes
+        Pesan yang akan disematkan.
+
+    output : str
+        Jalur file video hasil (`.mkv` atau `.avi`).
+
+    bits : int
+        Jumlah bit per kanal (1 - 4).
+
+    codec, level, stats : str, int or None, dict or None
+        Kompresi payload dan ringkasannya (lihat `embed_array`).
+
+    fourcc : str
+        Codec video hasil. Harus lossless, misal "FFV1", "HFYU", atau "png ".
+
+    Returns
+    -------
+    self : int
+        Jumlah frame yang berisi pesan.
+    """
+    message, flags = frame_payload(message)
+    start_time = time.perf_counter()
+    payload = compress_payload(message, codec, level)
+    compress_time = time.perf_counter() - start_time
+
+    capture, info = open_video(filepath)
+    try:
+        per_frame, total = video_capacity(info, bits)
+        if info["frames"] and len(payload) > total:
+            raise ValueError(
+                f"Pesan terlalu panjang: {len(payload)} byte, kapasitas video {total} byte "
+                f"({bits} bit per kanal)."
+            )
+
+        set_id = hashlib.sha256(payload).digest()[:16]
+        count = max(1, math.ceil(len(payload) / per_frame))
+
+        mk_dir(os.path.dirname(output) or ".")
+        writer = FrameWriter(output, fourcc, info["fps"], (info["width"], info["height"]))
+        try:
+            start_time, index = time.perf_counter(), 0
+            while True:
+                success, frame = capture.read()
+                if not success:
+                    break
+                if index < count:
+                    chunk = payload[index * per_frame:(index + 1) * per_frame]
+                    write_frame(
+                        frame, VIDEO_HEADER.pack(set_id, index, count) + chunk,
+                        bits, CODECS[codec], FRAME_VIDEO | flags
+                    )
+                writer.write(frame)
+                index += 1
+        finally:
+            writer.close()
+    finally:
+        capture.release()
+
+    if index < count:
+        os.remove(output)
+        raise ValueError(
+            f"Pesan terlalu panjang: {len(payload)} byte, kapasitas video {per_frame * index} byte "
+            f"({bits} bit per kanal)."
+        )
+
+    if stats is not None:
+        stats.update(compression_stats(
+            codec, len(message), len(payload), bits,
+            compress_time, time.perf_counter() - start_time
+        ))
+    return count
+
+@METRICS.timed("extract_video")
+def read_video(filepath):
+    """Ekstrak pesan dari video hasil `embed_video`
+
+    Frame dibaca satu per satu dan pembacaan berhenti setelah frame terakhir
+    yang berisi pesan.
+
+    Parameters
+    ----------
+    filepath : str
+        Jalur file video yang memiliki pesan disematkan.
+
+    Returns
+    -------
+    self : str
+        Pesan yang berhasil diekstrak.
+    """
+    capture, _ = open_video(filepath)
+    chunks, count, set_id, first = [], 1, None, None
+    try:
+        while len(chunks) < count:
+            success, frame = capture.read()
+            if not success:
+                break
+
+            found = read_frame(frame)
+            if found is None or not found[0]["flags"] & FRAME_VIDEO:
+                if not chunks:
+                    raise ValueError("Video tidak mengandung pesan.")
+                break
+
+            header, payload = found
+            frame_id, index, frame_count = VIDEO_HEADER.unpack_from(payload)
+            if not chunks:
+                set_id, count, first = frame_id, frame_count, header
+            elif frame_id != set_id or index != len(chunks):
+                raise ValueError("Urutan frame video tidak sesuai, video telah diubah.")
+            chunks.append(payload[VIDEO_HEADER.size:])
+    finally:
+        capture.release()
+
+    if len(chunks) != count:
+        raise ValueError(f"Pesan video tidak lengkap: ditemukan {len(chunks)} dari {count} frame.")
+
+    payload = b"".join(chunks)
+    if hashlib.sha256(payload).digest()[:16] != set_id:
+        raise ValueError("Payload hasil penyusunan frame tidak cocok.")
+    return frame_text(decompress_payload(payload, first["codec"]), first["flags"])
+
+def to_ascii(text):
+    """Mengonversi pesan teks ke dalam bentuk ASCII.
+
+    Parameters
+    ----------
+    text : str
+        Teks atau pesan yang akan diolah.
+
+    Returns
+    -------
+    self : list
+        Daftar yang berisi nilai ASCII setiap karakter.
+    """
+    ascii_form = []
+    for char in text:
+        ascii_form.append(ord(char))
+    return ascii_form
+
+class KeyCipher():
+    """Cipher per karakter dengan tabel hasil perhitungan
+
+    Alfabet pesan kecil dan berulang, sehingga setiap kode karakter cukup
+    dienkripsi satu kali dengan `kode * e % n`. Hasilnya disimpan di tabel
+    enkripsi `enc_` beserta kebalikannya di `dec_`, lalu karakter berikutnya
+    cukup dicari di dalam dict.
+
+    Parameters
+    ----------
+    n_ : int
+        Modulus kunci.
+
+    e_ : int or None
+        Eksponen publik. Dibutuhkan untuk `encrypt`.
+
+    d_ : int or None
+        Eksponen privat. Dibutuhkan untuk `decrypt` pada chipertext yang belum
+        ada di tabel.
+
+    max_size_ : int
+        Jumlah pasangan maksimum di tabel. Setelah penuh, karakter baru tetap
+        dihitung tetapi tidak disimpan, sehingga chipertext dari sumber yang
+        tidak dipercaya tidak dapat membuat tabel tumbuh tanpa batas.
+    """
+
+    def __init__(self, n_, e_= None, d_= None, max_size_= 4096):
+        self.n_ = n_
+        self.e_ = e_
+        self.d_ = d_
+        self.max_size_ = max_size_
+        self.enc_ = {}
+        self.dec_ = {}
+
+    def _store(self, code, sym):
+        if len(self.dec_) < self.max_size_:
+            self.enc_[code] = sym
+            self.dec_[sym] = code
+
+    def encrypt(self, text):
+        """Enkripsi teks menjadi daftar chipertext"""
+        codes = to_ascii(text)
+        table = {}
+        for code in set(codes):
+            sym = self.enc_.get(code)
+            if sym is None:
+                sym = BACKEND.mulmod(code, self.e_, self.n_)
+                self._store(code, sym)
+            table[code] = sym
+        return [table[code] for code in codes]
+
+    def decrypt(self, chipertext):
+        """Dekripsi daftar chipertext menjadi teks"""
+        table = {}
+        for sym in set(chipertext):
+            code = self.dec_.get(sym)
+            if code is None:
+                code = BACKEND.mulmod(sym, self.d_, self.n_)
+                if code >= 0x110000:
+                    raise ValueError("Chipertext tidak valid untuk kunci ini.")
+                self._store(code, sym)
+            table[sym] = code
+        return "".join([chr(table[sym]) for sym in chipertext])
+
+@functools.lru_cache(maxsize= 16)
+def get_cipher(n, e= None, d= None):
+    """Ambil `KeyCipher` untuk suatu kunci
+
+    Objek cipher disimpan dalam cache LRU sehingga tabel untuk kunci yang
+    sering dipakai tidak perlu dibangun ulang. Kunci yang paling lama tidak
+    dipakai akan dikeluarkan dari cache.
+    """
+    return KeyCipher(n, e, d)
+
+@METRICS.timed("encrypt")
+def encrypt_msg(text, e, n):
+    """Enkripsi pesan per karakter
+
+    Parameters
+    ----------
+    text : str
+        Pesan yang akan dienkripsi.
+
+    e, n : int
+        Eksponen publik dan modulus kunci.
+
+    Returns
+    -------
+    self : list
+        Daftar chipertext, satu bilangan untuk setiap karakter.
+    """
+    return get_cipher(n, e= e).encrypt(text)
+
+@METRICS.timed("decrypt")
+def decrypt_msg(chipertext, d, n):
+    """Dekripsi pesan per karakter
+
+    Parameters
+    ----------
+    chipertext : list
+        Daftar chipertext dari `encrypt_msg`.
+
+    d, n : int
+        Eksponen privat dan modulus kunci.
+
+    Returns
+    -------
+    self : str
+        Pesan asli hasil dekripsi.
+    """
+    return get_cipher(n, d= d).decrypt(chipertext)
+
+"""Binary Chipertext
+
+Format biner untuk chipertext. Header berisi penanda `VSCT`, versi, mode,
+sidik jari kunci (16 byte), lebar simbol dalam byte, dan jumlah simbol. Setelah
+header, setiap simbol disimpan sebagai bilangan big-endian dengan lebar tetap,
+sehingga simbol ke-i dapat dibaca langsung tanpa mengurai seluruh file.
+"""
+
+CHIPERTEXT_MAGIC = b"VSCT"
+CHIPERTEXT_HEADER = struct.Struct(">4sBB16sIQ")
+
+## mode chipertext
+CHIPERTEXT_CHAR = 0
+CHIPERTEXT_HYBRID = 1
+CHIPERTEXT_BLOCK = 2
+
+CIPHER_MODES = {"char": CHIPERTEXT_CHAR, "hybrid": CHIPERTEXT_HYBRID, "block": CHIPERTEXT_BLOCK}
+
+def key_fingerprint(n, e):
+    """Sidik jari kunci (16 byte) dari modulus dan eksponen publik"""
+    digest = hashlib.sha256()
+    for x in (n, e):
+        digest.update(x.to_bytes((x.bit_length() + 7) // 8, "big"))
+    return digest.digest()[:16]
+
+@METRICS.timed("chipertext_serialize")
+def pack_chipertext(chipertext, n, e, mode= CHIPERTEXT_CHAR, body= b""):
+    """Susun chipertext ke dalam format biner
+
+    Parameters
+    ----------
+    chipertext : list
+        Daftar chipertext (bilangan bulat kurang dari n).
+
+    n, e : int
+        Modulus dan eksponen publik kunci yang dipakai.
+
+    mode : int
+        Jenis isi chipertext. `CHIPERTEXT_CHAR` berarti satu simbol per
+        karakter, `CHIPERTEXT_HYBRID` berarti satu simbol kunci sesi, dan
+        `CHIPERTEXT_BLOCK` berarti satu simbol per blok byte.
+
+    body : bytes
+        Data tambahan setelah simbol, misalnya payload mode hybrid.
+
+    Returns
+    -------
+    self : bytes
+        Header, simbol-simbol chipertext, dan data tambahan.
+    """
+    width = (n.bit_length() + 7) // 8
+    header = CHIPERTEXT_HEADER.pack(
+        CHIPERTEXT_MAGIC, 1, mode, key_fingerprint(n, e), width, len(chipertext)
+    )
+    return header + b"".join([sym.to_bytes(width, "big") for sym in chipertext]) + body
+
+def to_chipertext(chipertext, n, e, filename= "chipertext.bin", filepath= "./data/keys"):
+    """Simpan chipertext ke dalam file biner
+
+    Parameters
+    ----------
+    chipertext : list
+        Daftar chipertext.
+
+    n, e : int
+        Modulus dan eksponen publik kunci yang dipakai.
+
+    filename : str
+        Nama file.
+
+    filepath : str
+        Jalur direktori tempat file akan disimpan.
+    """
+    mk_dir(filepath)
+    with open(f"{filepath}/{filename}", "wb") as file:
+        file.write(pack_chipertext(chipertext, n, e))
+
+class ChipertextReader():
+    """Pembaca chipertext biner
+
+    File dibuka dengan `mmap` sehingga hanya simbol yang diakses yang dibaca
+    dari disk. Mendukung `len`, indeks, slice, dan iterasi.
+
+    Parameters
+    ----------
+    source : str or bytes-like
+        Jalur file chipertext atau buffer yang berisi chipertext biner.
+
+    Attributes
+    ----------
+    mode_ : int
+        Jenis isi chipertext.
+
+    fingerprint_ : bytes
+        Sidik jari kunci yang dipakai saat enkripsi.
+
+    width_ : int
+        Lebar satu simbol dalam byte.
+
+    count_ : int
+        Jumlah simbol.
+    """
+
+    def __init__(self, source):
+        self.file_ = None
+        if isinstance(source, (str, os.PathLike)):
+            self.file_ = open(source, "rb")
+            try:
+                source = mmap.mmap(self.file_.fileno(), 0, access= mmap.ACCESS_READ)
+            except (ValueError, OSError) as desc:
+                self.file_.close()
+                ## mmap menolak file kosong dengan ValueError
+                if isinstance(desc, ValueError):
+                    raise ValueError("Chipertext tidak valid: header tidak lengkap.")
+                raise
+        self.buffer_ = source
+
+        try:
+            self._parse_header()
+        except ValueError:
+            self.close()
+            raise
+
+    def _parse_header(self):
+        if len(self.buffer_) < CHIPERTEXT_HEADER.size:
+            raise ValueError("Chipertext tidak valid: header tidak lengkap.")
+        magic, version, self.mode_, self.fingerprint_, self.width_, self.count_ = \
+            CHIPERTEXT_HEADER.unpack_from(self.buffer_)
+        if magic != CHIPERTEXT_MAGIC or version != 1:
+            raise ValueError("Chipertext tidak valid: format tidak dikenali.")
+        if len(self.buffer_) < CHIPERTEXT_HEADER.size + self.width_ * self.count_:
+            raise ValueError("Chipertext tidak valid: data terpotong.")
+
+    def __len__(self):
+        return self.count_
+
+    def _symbol(self, index):
+        start = CHIPERTEXT_HEADER.size + index * self.width_
+        return int.from_bytes(self.buffer_[start:start + self.width_], "big")
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._symbol(i) for i in range(*index.indices(self.count_))]
+        if index < 0:
+            index += self.count_
+        if not 0 <= index < self.count_:
+            raise IndexError("Indeks chipertext di luar jangkauan.")
+        return self._symbol(index)
+
+    def __iter__(self):
+        for i in range(self.count_):
+            yield self._symbol(i)
+
+    def body(self):
+        """Data tambahan setelah simbol terakhir"""
+        return bytes(self.buffer_[CHIPERTEXT_HEADER.size + self.width_ * self.count_:])
+
+    def close(self):
+        if self.file_ is not None:
+            self.buffer_.close()
+            self.file_.close()
+            self.file_ = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+@METRICS.timed("chipertext_parse")
+def read_chipertext(filepath, fingerprint= None):
+    """Baca daftar chipertext
+
+    Format biner (`to_chipertext`) dikenali dari penandanya. File lain
+    dianggap dokumen docx lama yang berisi daftar bilangan desimal.
+
+    Parameters
+    ----------
+    filepath : str or bytes-like
+        Jalur file chipertext, atau isi file chipertext.
+
+    fingerprint : bytes or None
+        Jika diisi, sidik jari pada chipertext biner harus sama dengan nilai
+        ini (lihat `key_fingerprint`).
+
+    Returns
+    -------
+    self : list
+        Daftar chipertext.
+    """
+    if isinstance(filepath, (bytes, bytearray, memoryview)):
+        magic = bytes(filepath[:len(CHIPERTEXT_MAGIC)])
+    else:
+        with open(filepath, "rb") as file:
+            magic = file.read(len(CHIPERTEXT_MAGIC))
+
+    if magic == CHIPERTEXT_MAGIC:
+        with ChipertextReader(filepath) as reader:
+            if fingerprint is not None and reader.fingerprint_ != fingerprint:
+                raise ValueError("Kunci tidak cocok dengan chipertext.")
+            return reader[:]
+
+    if not isinstance(filepath, str):
+        filepath = io.BytesIO(filepath)
+    try:
+        text = get_docx(filepath)
+    except (zipfile.BadZipFile, KeyError, ValueError):
+        raise ValueError("Chipertext tidak valid: format tidak dikenali.")
+    return [int(x.group()) for x in re.finditer(r"\d+", text)]
+
+"""Hybrid Encryption
+
+Perhitungan VS-RSA (`generate_keys`, e, d, n) hanya dipakai untuk membungkus
+kunci sesi acak 32 byte. Payload dienkripsi dengan stream cipher berbasis
+SHAKE-256 dan diautentikasi dengan HMAC-SHA256, sehingga ukuran chipertext dan
+waktu enkripsi sebanding dengan panjang pesan dalam byte. Isi chipertext mode
+hybrid: satu simbol kunci sesi, lalu nonce (16 byte), tag (32 byte), dan
+payload terenkripsi.
+"""
+
+HYBRID_NONCE = 16
+HYBRID_TAG = 32
+
+def session_keys(session, nonce):
+    """Turunkan kunci stream cipher dan kunci MAC dari kunci sesi"""
+    stream = hashlib.sha256(b"vs-stream" + session + nonce).digest()
+    mac = hashlib.sha256(b"vs-mac" + session + nonce).digest()
+    return stream, mac
+
+def stream_xor(key, data):
+    """XOR data dengan aliran kunci SHAKE-256"""
+    keystream = hashlib.shake_256(key).digest(len(data))
+    return np.bitwise_xor(
+        np.frombuffer(data, dtype= np.uint8), np.frombuffer(keystream, dtype= np.uint8)
+    ).tobytes()
+
+@METRICS.timed("encrypt_hybrid")
+def encrypt_hybrid(message, e, n):
+    """Enkripsi pesan dengan mode hybrid
+
+    Parameters
+    ----------
+    message : str or bytes
+        Pesan yang akan dienkripsi. str dikodekan sebagai UTF-8.
+
+    e, n : int
+        Eksponen publik dan modulus kunci.
+
+    Returns
+    -------
+    self : bytes
+        Chipertext biner (lihat `pack_chipertext`) dengan mode
+        `CHIPERTEXT_HYBRID`.
+    """
+    if isinstance(message, str):
+        message = message.encode("utf-8")
+
+    session, nonce = secrets.token_bytes(32), secrets.token_bytes(HYBRID_NONCE)
+    stream_key, mac_key = session_keys(session, nonce)
+
+    payload = stream_xor(stream_key, message)
+    tag = hmac.new(mac_key, nonce + payload, hashlib.sha256).digest()
+    wrapped = BACKEND.mulmod(int.from_bytes(session, "big"), e, n)
+    return pack_chipertext(
+        [wrapped], n, e, mode= CHIPERTEXT_HYBRID, body= nonce + tag + payload
+    )
+
+@METRICS.timed("decrypt_hybrid")
+def decrypt_hybrid(wrapped, body, d, n):
+    """Dekripsi chipertext mode hybrid
+
+    Parameters
+    ----------
+    wrapped : int
+        Simbol kunci sesi.
+
+    body : bytes
+        Nonce, tag, dan payload terenkripsi.
+
+    d, n : int
+        Eksponen privat dan modulus kunci.
+
+    Returns
+    -------
+    self : str
+        Pesan asli hasil dekripsi.
+    """
+    if len(body) < HYBRID_NONCE + HYBRID_TAG:
+        raise ValueError("Chipertext tidak valid: data terpotong.")
+    nonce, tag = body[:HYBRID_NONCE], body[HYBRID_NONCE:HYBRID_NONCE + HYBRID_TAG]
+    payload = body[HYBRID_NONCE + HYBRID_TAG:]
+
+    session = BACKEND.mulmod(wrapped, d, n)
+    if session >> 256:
+        raise ValueError("Kunci sesi tidak valid, kunci tidak cocok.")
+    stream_key, mac_key = session_keys(session.to_bytes(32, "big"), nonce)
+    if not hmac.compare_digest(tag, hmac.new(mac_key, nonce + payload, hashlib.sha256).digest()):
+        raise ValueError("Tag chipertext tidak cocok, chipertext rusak atau kunci salah.")
+    return stream_xor(stream_key, payload).decode("utf-8")
+
+"""Block Encryption
+
+Mode VS-RSA murni tanpa stream cipher. Pesan (UTF-8) diawali panjangnya
+(uint64) lalu dipotong menjadi blok sebesar mungkin yang tetap di bawah n.
+Setiap blok diawali 8 byte acak agar blok yang sama tidak menghasilkan simbol
+yang sama, dan sisa blok terakhir diisi byte acak. Jumlah operasi modular dan
+ukuran chipertext turun dari satu per karakter menjadi satu per blok.
+"""
+
+BLOCK_SALT = 8
+BLOCK_LENGTH = struct.Struct(">Q")
+
+def block_size(n):
+    """Jumlah byte pesan per blok untuk modulus n"""
+    size = (n.bit_length() - 1) // 8 - BLOCK_SALT
+    if size < 1:
+        raise ValueError("Modulus terlalu kecil untuk mode blok.")
+    return size
+
+@METRICS.timed("encrypt_block")
+def encrypt_blocks(message, e, n):
+    """Enkripsi pesan per blok byte
+
+    Parameters
+    ----------
+    message : str or bytes
+        Pesan yang akan dienkripsi. str dikodekan sebagai UTF-8.
+
+    e, n : int
+        Eksponen publik dan modulus kunci.
+
+    Returns
+    -------
+    self : list
+        Daftar chipertext, satu bilangan untuk setiap blok.
+    """
+    if isinstance(message, str):
+        message = message.encode("utf-8")
+
+    size = block_size(n)
+    data = BLOCK_LENGTH.pack(len(message)) + message
+    data += secrets.token_bytes(-len(data) % size)
+    return [
+        BACKEND.mulmod(int.from_bytes(secrets.token_bytes(BLOCK_SALT) + data[start:start + size], "big"), e, n)
+        for start in range(0, len(data), size)
+    ]
+
+@METRICS.timed("decrypt_block")
+def decrypt_blocks(chipertext, d, n):
+    """Dekripsi chipertext per blok byte
+
+    Parameters
+    ----------
+    chipertext : list
+        Daftar chipertext dari `encrypt_blocks`.
+
+    d, n : int
+        Eksponen privat dan modulus kunci.
+
+    Returns
+    -------
+    self : str
+        Pesan asli hasil dekripsi.
+    """
+    size = block_size(n)
+    data = b"".join([
+        BACKEND.mulmod(sym, d, n).to_bytes(BLOCK_SALT + size, "big")[BLOCK_SALT:] for sym in chipertext
+    ])
+    if len(data) < BLOCK_LENGTH.size:
+        raise ValueError("Chipertext tidak valid: data terpotong.")
+
+    length = BLOCK_LENGTH.unpack_from(data)[0]
+    if length > len(data) - BLOCK_LENGTH.size:
+        raise ValueError("Panjang pesan tidak valid, kunci tidak cocok.")
+    return data[BLOCK_LENGTH.size:BLOCK_LENGTH.size + length].decode("utf-8")
+
+def encrypt_chipertext(message, keys, mode= CHIPERTEXT_HYBRID):
+    """Enkripsi pesan menjadi chipertext biner
+
+    Parameters
+    ----------
+    message : str
+        Pesan yang akan dienkripsi.
+
+    keys : tuple
+        Kunci dari `generate_keys` atau `read_key`.
+
+    mode : int
+        `CHIPERTEXT_HYBRID`, `CHIPERTEXT_BLOCK`, atau `CHIPERTEXT_CHAR`.
+
+    Returns
+    -------
+    self : bytes
+        Chipertext biner.
+    """
+    p, q, r, s, e, t, n, u, d = keys
+    if mode == CHIPERTEXT_HYBRID:
+        return encrypt_hybrid(message, e, n)
+    if mode == CHIPERTEXT_BLOCK:
+        return pack_chipertext(encrypt_blocks(message, e, n), n, e, mode= CHIPERTEXT_BLOCK)
+    if mode == CHIPERTEXT_CHAR:
+        return pack_chipertext(encrypt_msg(message, e, n), n, e)
+    raise ValueError(f"Mode chipertext {mode} tidak dikenal.")
+
+def decrypt_chipertext(source, keys):
+    """Dekripsi chipertext sesuai mode yang tercatat di header
+
+    Parameters
+    ----------
+    source : str or bytes-like
+        Jalur file chipertext atau isinya. Dokumen docx lama berisi daftar
+        bilangan desimal juga diterima.
+
+    keys : tuple
+        Kunci dari `read_key`.
+
+    Returns
+    -------
+    self : str
+        Pesan asli hasil dekripsi.
+    """
+    p, q, r, s, e, t, n, u, d = keys
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        magic = bytes(source[:len(CHIPERTEXT_MAGIC)])
+    else:
+        with open(source, "rb") as file:
+            magic = file.read(len(CHIPERTEXT_MAGIC))
+    if magic != CHIPERTEXT_MAGIC:
+        return decrypt_msg(read_chipertext(source), d, n)
+
+    with ChipertextReader(source) as reader:
+        if reader.fingerprint_ != key_fingerprint(n, e):
+            raise ValueError("Kunci tidak cocok dengan chipertext.")
+        if reader.mode_ == CHIPERTEXT_HYBRID:
+            return decrypt_hybrid(reader[0], reader.body(), d, n)
+        if reader.mode_ == CHIPERTEXT_BLOCK:
+            return decrypt_blocks(reader[:], d, n)
+        if reader.mode_ == CHIPERTEXT_CHAR:
+            return decrypt_msg(reader[:], d, n)
+    raise ValueError(f"Mode chipertext {reader.mode_} tidak dikenal.")
+
+"""Self-contained Artifacts
+
+Chipertext biner disematkan langsung ke dalam gambar (flag `FRAME_CHIPERTEXT`)
+sehingga pembacaan hanya membutuhkan gambar dan kunci, tanpa file chipertext
+terpisah.
+"""
+
+def embed_secret_array(image, message, keys, bits= 1, codec= "none", level= None, stats= None, mode= CHIPERTEXT_HYBRID):
+    """Enkripsi pesan lalu sematkan chipertext ke array gambar (in-place)
+
+    Dipakai jika hasil tidak langsung disimpan, misalnya agar file PNG baru
+    dienkode saat pengguna mengunduhnya. Parameter sama dengan `embed_secret`.
+
+    Returns
+    -------
+    image : NumPy array
+        Array gambar BGR yang sama dengan masukan, sudah berisi chipertext.
+    """
+    payload = encrypt_chipertext(message, keys, mode)
+    embed_array(
+        image, payload, bits, codec= codec, level= level, stats= stats,
+        flags= FRAME_CHIPERTEXT
+    )
+    return image
+
+def embed_secret(buffer, message, keys, bits= 1, codec= "none", level= None, stats= None, mode= CHIPERTEXT_HYBRID):
+    """Enkripsi pesan lalu sematkan chipertext ke gambar di memori
+
+    Parameters
+    ----------
+    buffer : bytes-like or NumPy array
+        Isi file gambar atau array gambar BGR.
+
+    message : str
+        Pesan yang akan dienkripsi dan disematkan.
+
+    keys : tuple
+        Kunci dari `generate_keys` atau `read_key`.
+
+    bits, codec, level, stats
+        Lihat `embed_array`.
+
+    mode : int
+        Mode enkripsi (lihat `encrypt_chipertext`).
+
+    Returns
+    -------
+    self : bytes
+        Isi file PNG hasil penyematan.
+    """
+    image = embed_secret_array(
+        decode_image(buffer), message, keys, bits, codec, level, stats, mode
+    )
+    return encode_image(image)
+
+def read_secret(buffer, keys):
+    """Ekstrak chipertext dari gambar lalu dekripsi dengan kunci
+
+    Parameters
+    ----------
+    buffer : bytes-like or NumPy array
+        Isi file gambar atau array gambar BGR.
+
+    keys : tuple
+        Kunci dari `read_key`.
+
+    Returns
+    -------
+    self : str or None
+        Pesan hasil dekripsi. None jika gambar tidak berisi chipertext
+        (misalnya gambar lama dengan chipertext di file terpisah).
+    """
+    image = buffer if isinstance(buffer, np.ndarray) else decode_image(buffer)
+    frame = read_frame(image)
+    if frame is None or not frame[0]["flags"] & FRAME_CHIPERTEXT:
+        return None
+
+    header, payload = frame
+    return decrypt_chipertext(decompress_payload(payload, header["codec"]), keys)
+
+def convert_data_size(text, size_bit= None):
+    """Konversi data menjadi ukuran tertentu dalam byte.
+
+    Parameters
+    ----------
+    text : str
+        Data atau pesan yang akan dikonversi.
+
+    size_bit : int
+        Ukuran target dalam bit.
+
+    Return
+    ------
+    self : str
+        Teks dalam format ASCII yang telah dikonversi ukuran bit-nya.
+    """
+    if size_bit is None:
+        size_bit = len(text.encode("utf-8")) * 8
+    
+    thresh = int(size_bit / 8)
+
+    while len(text.encode("utf-8")) < thresh:
+        text += " "
+
+    bit_text = text.encode("utf-8")[:thresh]
+    return bit_text.decode("utf-8")
+
+def prime_fermat(num, num_tests= 100):
+    """Prime with Fermat Test
+
+    Cek apakah suatu bilangan adalah bilangan prima secara probabilitas dengan
+    Uji Fermat.
+
+    Parameters
+    ----------
+    num : int
+        Bilangan yang akan diperiksa
+
+    num_tests : int
+        Jumlah perulangan dalam uji coba Fermat yang dilakukan.
+
+    Returns
+    -------
+    self : bool
+        True jika bilangan adalah bilangan prima. False jika bukan.
+    """
+    if num <= 1:
+        return False
+    elif num <= 3:
+        return True
+    
+    def fermat_test(rand_num):
+        """Fermat Test
+
+        Parameters
+        ----------
+        rand_num : int
+            Bilangan bulat random
+        
+        Returns
+        -------
+        self : bool
+            True jika hasil uji berhasil dan False jika gagal.
+        """
+        if BACKEND.powmod(rand_num, num - 1, num) != 1:
+            return False
+        return True
+    
+    for i in range(num_tests):
+        rand_num = random.randint(2, num - 2)
+        if not fermat_test(rand_num):
+            return False
+    return True
+
+def small_primes(limit):
+    """Daftar bilangan prima kecil dengan Saringan Eratosthenes
+
+    Parameters
+    ----------
+    limit : int
+        Batas atas (tidak termasuk).
+
+    Returns
+    -------
+    self : list
+        Bilangan prima yang kurang dari `limit`.
+    """
+    sieve = bytearray([1]) * limit
+    sieve[:2] = b"\x00\x00"
+    for i in range(2, math.isqrt(limit) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytes(len(range(i * i, limit, i)))
+    return [i for i, is_prime in enumerate(sieve) if is_prime]
+
+SMALL_PRIMES = small_primes(1 << 14)
+
+def prime_miller_rabin(num, num_tests= 8):
+    """Prime with Miller-Rabin Test
+
+    Cek apakah suatu bilangan adalah bilangan prima secara probabilitas dengan
+    Uji Miller-Rabin. Bilangan diperiksa terlebih dahulu terhadap pembagi
+    prima kecil sebelum melakukan eksponensiasi modular.
+
+    Parameters
+    ----------
+    num : int
+        Bilangan yang akan diperiksa.
+
+    num_tests : int
+        Jumlah basis acak dalam uji Miller-Rabin. Peluang bilangan komposit
+        lolos paling besar `4 ** -num_tests`.
+
+    Returns
+    -------
+    self : bool
+        True jika bilangan adalah bilangan prima. False jika bukan.
+    """
+    if num <= 3:
+        return num >= 2
+    for prime in SMALL_PRIMES[:64]:
+        if num % prime == 0:
+            return num == prime
+
+    odd, power = num - 1, 0
+    while odd % 2 == 0:
+        odd //= 2
+        power += 1
+
+    for _ in range(num_tests):
+        x = BACKEND.powmod(random.randint(2, num - 2), odd, num)
+        if x == 1 or x == num - 1:
+            continue
+        for _ in range(power - 1):
+            x = BACKEND.mulmod(x, x, num)
+            if x == num - 1:
+                break
+        else:
+            return False
+    return True
+
+def generate_prime(min_bit, max_bit, window= 4096, stats= None):
+    """Generate prime value
+
+    Menghasilkan bilangan prima antara panjang bit minimum dan maksimum.
+    Dari titik awal acak, `window` bilangan ganjil berurutan disaring terhadap
+    `SMALL_PRIMES` sehingga hanya kandidat tanpa pembagi kecil yang diuji
+    dengan `prime_miller_rabin`.
+
+    Parameters
+    ----------
+    min_bit : int
+        Panjang bit minimum.
+
+    max_bit : int
+        Panjang bit maksimum.
+
+    window : int
+        Jumlah kandidat ganjil yang disaring sekaligus.
+
+    stats : dict or None
+        Jika diisi, jumlah kandidat yang disaring (`candidates`) dan yang diuji
+        Miller-Rabin (`tested`) ditambahkan ke dalam dict ini.
+
+    Returns
+    -------
+    self : int
+        Bilangan prima dengan antara panjang bit minimum dan maksimum.
+    """
+    if stats is not None:
+        stats.setdefault("candidates", 0)
+        stats.setdefault("tested", 0)
+
+    while True:
+        base = random.getrandbits(random.randint(min_bit, max_bit)) | 1
+
+        sieve = bytearray([1]) * window
+        for prime in SMALL_PRIMES[1:]:
+            if prime >= base:
+                break
+            start = (prime - base % prime) * ((prime + 1) // 2) % prime
+            if start < window:
+                sieve[start::prime] = bytes(len(range(start, window, prime)))
+
+        for i, passed in enumerate(sieve):
+            candidate = base + 2 * i
+            if candidate.bit_length() > max_bit:
+                break
+            if stats is not None:
+                stats["candidates"] += 1
+            if not passed:
+                continue
+            if stats is not None:
+                stats["tested"] += 1
+            if prime_miller_rabin(candidate):
+                return candidate
+
+def search_pqr(min_bit, max_bit):
+    """Cari p, q, dan r secara serial
+
+    Parameters
+    ----------
+    min_bit : int
+        Panjang bit minimum untuk p (bilangan prima).
+
+    max_bit : int
+        Panjang bit maksimum untuk p (bilangan prima).
+
+    Returns
+    -------
+    self : tuple
+        Nilai p (bilangan prima), q, dan r (bilangan acak) dengan p < q * r.
+    """
+    p = generate_prime(min_bit, max_bit)
+    q = random.getrandbits(random.randint(min_bit, max_bit))
+    r = random.getrandbits(random.randint(min_bit, max_bit))
+
+    while p >= q * r:
+        p = generate_prime(min_bit, max_bit)
+        q = random.getrandbits(random.randint(min_bit, max_bit))
+        r = random.getrandbits(random.randint(min_bit, max_bit))
+    return p, q, r
+
+def seed_worker():
+    """Seed ulang `random` di setiap proses agar pencarian tidak kembar"""
+    random.seed()
+
+def generate_pqr(min_bit, max_bit, workers= 1):
+    """Generate prime (p) and random number (q and r)
+
+    Menghasilkan bilangan prima acak untuk p, q, dan r, dengan p < q * r.
+    Jika `workers` lebih dari 1, pencarian dijalankan bersamaan pada beberapa
+    proses. Hasil dari proses yang pertama selesai dipakai dan proses lainnya
+    dihentikan.
+
+    Parameters
+    ----------
+    min_bit : int
+        Panjang bit minimum untuk p (bilangan prima).
+    
+    max_bit : int
+        Panjang bit maksimum untuk p (bilangan prima).
+
+    workers : int
+        Jumlah proses pencarian. Mode paralel tidak dapat dipakai dari dalam
+        proses daemon (misalnya worker `multiprocessing.Pool`).
+
+    Returns
+    -------
+    self : tuple
+        Menghasilkan nilai tuple untuk p (bilangan prima), q, dan r
+        (bilangan acak).
+    """
+    if workers <= 1:
+        return search_pqr(min_bit, max_bit)
+
+    with multiprocessing.Pool(workers, initializer= seed_worker) as pool:
+        search = functools.partial(search_pqr, min_bit)
+        return next(pool.imap_unordered(search, [max_bit] * workers))
+
+def expand_euclidean(a, b):
+    """Euclidean expansion
+
+    Perluasan dari algoritma Euclidean untuk menemukan pembagi persekutuan
+    terbesar (PBB) dari dua bilangan bulat. Ini juga untuk menemukan dua
+    bilangan bulat yang memenuhi persamaan `ax + by = PBB(a, b)`.
+    
+    Parameters
+    ----------
+    a : int
+        Bilangan bulat pertama.
+
+    b : int
+        Bilangan bulat kedua.
+
+    Returns:
+    X1 : int
+        Nilai koefisien X1 yang merupakan invers modular bilangan bulat
+        pertama terhadap bilangan bulat kedua. Hal ini dibuktikan dengan
+        persamaan `ax + by = PBB(a, b)`.
+    """
+    return BACKEND.gcdext(a, b)[1]
+
+def inverse_modular(num, mod):
+    """Calculate of Inverse Modular
+
+    Mencari invers modular dari bilangan bulat terhadap nilai modulus.
+    Invers modular digunakan untuk melakukan perkalian modular.
+
+    Parameters
+    ----------
+    num : int
+        Bilangan yang ingin dicari invers modular.
+    
+    mod : int
+        Bilangan modulusnya.
+
+    Returns
+    -------
+    inv : int or None
+        Invers modular bilangan bulat terhadap modulus (dalam batasan
+        0 <= invers <= modulus). None jika invers tidak ditemukan
+        (misalnya bilangan bulat dan modulus tidak coprime atau
+        bilangan prima).
+    """
+    try:
+        return BACKEND.invert(num, mod)
+    except ValueError:
+        return None
+
+@METRICS.timed("keygen")
+def generate_keys(workers= 1):
+    """Generate keys
+    
+    Menghasilkan kunci kriptografi Vincent-Sathiyamoorthy RSA.
+
+    Parameters
+    ----------
+    workers : int
+        Jumlah proses untuk pencarian p, q, dan r. Lihat `generate_pqr`.
+
+    Returns
+    -------
+    self : tuple
+        Berisi bilangan prima (p), bilangan acak (q dan r), kombinasi bilangan
+        prima yang dhitung dengan `(q * r) - p` (s), ekponen publik untuk
+        enkripsi pesan (e), nilai kombinasi untuk perhitungan eksponen privat
+        dihitung dengan `(pow(p, 2) * s) + q` (t), modulus kunci untuk enkripsi
+        dan dekripsi pesan (n), inverse modular dari p modulo n (u), dan
+        eksponen privat untuk dekripsi pesan yang dihitung menggunakan invers
+        modular u dari p modulo n (d)
+    """
+    min_bit = 1024
+    max_bit = 2048
+
+    ## ulangi dengan p, q, r baru jika p tidak memiliki invers modulo n
+    u = None
+    while u is None:
+        p, q, r = generate_pqr(min_bit, max_bit, workers)
+        s = (q * r) - p
+        e = (p * s) + r
+        t = (pow(p, 2) * s) + q
+        n = ((e * t) - p) // s
+        u = inverse_modular(p, n)
+    d = u * t
+
+    return p, q, r, s, e, t, n, u, d
+
+"""Binary Keys
+
+Format biner untuk kunci. Header berisi penanda `VSKY`, versi, sidik jari
+kunci (16 byte), dan jumlah nilai. Setiap nilai p, q, r, s, e, t, n, u, d
+disimpan sebagai panjang (4 byte) diikuti byte big-endian dari bilangannya,
+sehingga tidak ada konversi desimal saat menyimpan maupun membaca.
+"""
+
+KEY_MAGIC = b"VSKY"
+KEY_HEADER = struct.Struct(">4sB16sB")
+
+@METRICS.timed("key_serialize")
+def pack_keys(keys):
+    """Susun kunci ke dalam format biner
+
+    Parameters
+    ----------
+    keys : tuple
+        Kunci p, q, r, s, e, t, n, u, d dari `generate_keys`.
+
+    Returns
+    -------
+    self : bytes
+        Header dan nilai-nilai kunci.
+    """
+    p, q, r, s, e, t, n, u, d = keys
+    data = [KEY_HEADER.pack(KEY_MAGIC, 1, key_fingerprint(n, e), len(keys))]
+    for x in keys:
+        raw = x.to_bytes((x.bit_length() + 7) // 8, "big")
+        data.append(struct.pack(">I", len(raw)) + raw)
+    return b"".join(data)
+
+def parse_keys(data):
+    """Baca kunci dari format biner
+
+    Parameters
+    ----------
+    data : bytes-like
+        Isi file kunci dari `pack_keys`.
+
+    Returns
+    -------
+    self : tuple
+        Kunci p, q, r, s, e, t, n, u, d.
+    """
+    data = memoryview(data)
+    if len(data) < KEY_HEADER.size:
+        raise ValueError("Kunci tidak valid: header tidak lengkap.")
+    magic, version, fingerprint, count = KEY_HEADER.unpack_from(data)
+    if magic != KEY_MAGIC or version != 1 or count != 9:
+        raise ValueError("Kunci tidak valid: format tidak dikenali.")
+
+    keys, offset = [], KEY_HEADER.size
+    for _ in range(count):
+        if offset + 4 > len(data):
+            raise ValueError("Kunci tidak valid: data terpotong.")
+        (size,) = struct.unpack_from(">I", data, offset)
+        offset += 4
+        if offset + size > len(data):
+            raise ValueError("Kunci tidak valid: data terpotong.")
+        keys.append(int.from_bytes(data[offset:offset + size], "big"))
+        offset += size
+
+    p, q, r, s, e, t, n, u, d = keys
+    if key_fingerprint(n, e) != fingerprint:
+        raise ValueError("Kunci tidak valid: sidik jari tidak cocok.")
+    return p, q, r, s, e, t, n, u, d
+
+def to_key(keys, filename= "keys.key", filepath= "./data/keys"):
+    """Simpan kunci ke dalam file biner
+
+    Parameters
+    ----------
+    keys : tuple
+        Kunci p, q, r, s, e, t, n, u, d.
+
+    filename : str
+        Nama file.
+
+    filepath : str
+        Jalur direktori tempat file akan disimpan.
+    """
+    mk_dir(filepath)
+    with open(f"{filepath}/{filename}", "wb") as file:
+        file.write(pack_keys(keys))
+
+@METRICS.timed("key_parse")
+def read_key(filepath):
+    """Read keys
+
+    Membaca kunci kriptografi Vincent-Sathiyamoorthy RSA. File biner dari
+    `to_key` dikenali dari penandanya. File lain dianggap file docx lama.
+
+    Parameters
+    ----------
+    filepath : str or bytes-like
+        Jalur direktori dari file yang akan di olah, atau isi file kunci.
+    
+    Returns
+    -------
+    self : tuple
+        Kunci-kunci yang dimiliki, terdiri dari p, q, r, s, e, t, n, u, d.
+
+    Lebih lanjut `Generate Keys Vincent-Sathiyamoorthy RSA`.
+    """
+    if isinstance(filepath, (bytes, bytearray, memoryview)):
+        data = bytes(filepath)
+    else:
+        with open(filepath, "rb") as file:
+            data = file.read()
+    if data.startswith(KEY_MAGIC):
+        return parse_keys(data)
+
+    try:
+        text = get_docx(io.BytesIO(data))
+    except (zipfile.BadZipFile, KeyError, ValueError):
+        raise ValueError("Kunci tidak valid: format tidak dikenali.")
+    keys = [int(Decimal(x.group())) for x in re.finditer(r"\d+", text)]
+    if len(keys) < 9:
+        raise ValueError("Kunci tidak valid: jumlah nilai kunci kurang dari 9.")
+    p, q, r, s, e, t, n, u, d = keys[0], keys[1], keys[2], keys[3], \
+        keys[4], keys[5], keys[6], keys[7], keys[8]
+    return p, q, r, s, e, t, n, u, d
+
+class KeyPool():
+    """Kumpulan kunci siap pakai
+
+    Menyimpan sejumlah kunci hasil `generate_keys` yang dibuat di latar
+    belakang, sehingga permintaan kunci cukup mengambil satu kunci dari
+    antrean. Setiap kunci disimpan sebagai satu file di `dirpath_` agar
+    kumpulan tetap tersedia setelah aplikasi dimulai ulang. Kunci baru
+    diberikan setelah filenya berhasil dihapus. Beberapa kumpulan (misal
+    beberapa replika aplikasi) boleh memakai folder yang sama: hanya satu yang
+    berhasil menghapus file, sehingga satu kunci tidak pernah dipakai dua kali.
+
+    Parameters
+    ----------
+    size_ : int
+        Jumlah kunci yang dijaga di dalam kumpulan.
+
+    low_water_ : int
+        Batas bawah jumlah kunci. Pengisian ulang dimulai ketika jumlah kunci
+        kurang dari nilai ini.
+
+    dirpath_ : str
+        Folder tempat kunci disimpan.
+
+    workers_ : int
+        Jumlah proses yang membuat kunci secara paralel.
+    """
+
+    def __init__(
+        self, size_= 8, low_water_= 2, dirpath_= "./data/keys/pool", workers_= 1
+    ):
+        self.size_ = size_
+        self.low_water_ = low_water_
+        self.dirpath_ = dirpath_
+        self.workers_ = workers_
+
+        self.keys_ = deque()
+        self.lock_ = threading.Lock()
+        self.event_ = threading.Event()
+        self.stop_ = False
+
+        mk_dir(dirpath_)
+        self._load()
+
+        self.thread_ = threading.Thread(target= self._refill, daemon= True)
+        self.thread_.start()
+        self.event_.set()
+
+    def __len__(self):
+        return len(self.keys_)
+
+    def _load(self):
+        """Muat kunci yang tersimpan dari sesi sebelumnya"""
+        for filename in sorted(os.listdir(self.dirpath_)):
+            if not filename.endswith(".json"):
+                continue
+            filepath = f"{self.dirpath_}/{filename}"
+            try:
+                with open(filepath) as file:
+                    keys = tuple(int(x, 16) for x in json.load(file))
+            except (OSError, ValueError):
+                continue
+            self.keys_.append((filepath, keys))
+
+    def _push(self, keys):
+        """Simpan kunci baru ke file lalu masukkan ke antrean"""
+        filepath = f"{self.dirpath_}/{uuid.uuid4().hex}.json"
+        with open(f"{filepath}.tmp", "w") as file:
+            json.dump([format(x, "x") for x in keys], file)
+        os.replace(f"{filepath}.tmp", filepath)
+
+        with self.lock_:
+            self.keys_.append((filepath, keys))
+
+    def _refill(self):
+        """Thread latar belakang yang mengisi kumpulan hingga `size_`
+
+        Kegagalan satu pembuatan kunci dicatat lalu dilewati agar thread tetap
+        berjalan. Pool proses yang rusak dibuat ulang.
+        """
+        pool = ProcessPoolExecutor(max_workers= self.workers_)
+        try:
+            while True:
+                self.event_.wait()
+                self.event_.clear()
+                if self.stop_:
+                    break
+
+                missing = self.size_ - len(self.keys_)
+                futures = [pool.submit(generate_keys) for _ in range(missing)]
+                for future in as_completed(futures):
+                    if self.stop_:
+                        break
+                    try:
+                        self._push(future.result())
+                    except Exception as desc:
+                        METRICS.count("keypool_errors")
+                        LOGGER.warning("Gagal mengisi kumpulan kunci: %r", desc)
+                        if isinstance(desc, BrokenProcessPool):
+                            pool.shutdown(wait= False, cancel_futures= True)
+                            pool = ProcessPoolExecutor(max_workers= self.workers_)
+                            break
+        finally:
+            pool.shutdown(wait= False, cancel_futures= True)
+
+    def pop(self):
+        """Ambil satu kunci
+
+        Returns
+        -------
+        self : tuple
+            Kunci p, q, r, s, e, t, n, u, d. Jika kumpulan sedang kosong, kunci
+            dibuat langsung dengan `generate_keys` memakai semua CPU.
+        """
+        while True:
+            with self.lock_:
+                item = self.keys_.popleft() if self.keys_ else None
+                if len(self.keys_) < self.low_water_:
+                    self.event_.set()
+
+            if item is None:
+                return generate_keys(workers= os.cpu_count())
+
+            ## file yang sudah hilang berarti kunci telah diambil proses lain
+            filepath, keys = item
+            try:
+                os.remove(filepath)
+            except FileNotFoundError:
+                continue
+            return keys
+
+    def close(self):
+        """Hentikan thread pengisian ulang"""
+        self.stop_ = True
+        self.event_.set()
+        self.thread_.join()
+
+class ResultCache():
+    """Cache hasil berbasis isi
+
+    Menyimpan hasil pembacaan pesan dengan kunci berupa hash dari isi gambar,
+    kunci, dan chipertext. Cache terdiri dari tingkat memori (LRU) dan tingkat
+    disk opsional yang dibatasi ukurannya. File terlama di disk dihapus ketika
+    batas terlampaui.
+
+    Parameters
+    ----------
+    capacity_ : int
+        Jumlah hasil maksimum di tingkat memori.
+
+    dirpath_ : str or None
+        Folder tingkat disk. None berarti hanya memakai memori. Hasil disimpan
+        apa adanya (tidak terenkripsi), sehingga tingkat disk hanya untuk
+        hasil yang tidak rahasia.
+
+    max_bytes_ : int
+        Ukuran total maksimum file di tingkat disk (dalam byte).
+
+    Attributes
+    ----------
+    hits_ : int
+        Jumlah pencarian yang ditemukan (memori maupun disk).
+
+    disk_hits_ : int
+        Jumlah pencarian yang ditemukan di tingkat disk.
+
+    misses_ : int
+        Jumlah pencarian yang tidak ditemukan.
+    """
+
+    def __init__(self, capacity_= 128, dirpath_= None, max_bytes_= 256 * 1024 ** 2):
+        self.capacity_ = capacity_
+        self.dirpath_ = dirpath_
+        self.max_bytes_ = max_bytes_
+
+        self.memory_ = OrderedDict()
+        self.lock_ = threading.Lock()
+        self.hits_, self.disk_hits_, self.misses_ = 0, 0, 0
+
+        self.disk_bytes_ = 0
+        if dirpath_ is not None:
+            mk_dir(dirpath_)
+            for entry in os.scandir(dirpath_):
+                self.disk_bytes_ += entry.stat().st_size
+
+    @staticmethod
+    def make_key(*parts):
+        """Buat kunci cache dari isi beberapa buffer"""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(hashlib.sha256(part).digest())
+        return digest.hexdigest()
+
+    def _remember(self, key, value):
+        self.memory_[key] = value
+        self.memory_.move_to_end(key)
+        while len(self.memory_) > self.capacity_:
+            self.memory_.popitem(last= False)
+
+    def get(self, key):
+        """Ambil hasil dari cache
+
+        Returns
+        -------
+        self : object or None
+            Hasil yang tersimpan, atau None jika tidak ditemukan.
+        """
+        with self.lock_:
+            if key in self.memory_:
+                self.memory_.move_to_end(key)
+                self.hits_ += 1
+                METRICS.count("cache_hits")
+                return self.memory_[key]
+
+            if self.dirpath_ is not None:
+                filepath = f"{self.dirpath_}/{key}.json"
+                try:
+                    with open(filepath, encoding= "utf-8") as file:
+                        value = json.load(file)
+                    os.utime(filepath)
+                except (OSError, ValueError):
+                    pass
+                else:
+                    self._remember(key, value)
+                    self.hits_ += 1
+                    self.disk_hits_ += 1
+                    METRICS.count("cache_hits")
+                    return value
+
+            self.misses_ += 1
+            METRICS.count("cache_misses")
+            return None
+
+    def put(self, key, value):
+        """Simpan hasil (harus dapat diserialisasi JSON) ke dalam cache"""
+        with self.lock_:
+            self._remember(key, value)
+            if self.dirpath_ is None:
+                return
+
+            filepath = f"{self.dirpath_}/{key}.json"
+            if os.path.exists(filepath):
+                return
+            with open(f"{filepath}.tmp", "w", encoding= "utf-8") as file:
+                json.dump(value, file)
+            os.replace(f"{filepath}.tmp", filepath)
+            self.disk_bytes_ += os.path.getsize(filepath)
+
+            if self.disk_bytes_ > self.max_bytes_:
+                self._evict_disk()
+
+    def _evict_disk(self):
+        """Hapus file terlama hingga ukuran disk di bawah batas"""
+        entries = sorted(os.scandir(self.dirpath_), key= lambda x: x.stat().st_mtime)
+        for entry in entries:
+            if self.disk_bytes_ <= self.max_bytes_:
+                break
+            size = entry.stat().st_size
+            os.remove(entry.path)
+            self.disk_bytes_ -= size
+
+    def stats(self):
+        """Ringkasan penghitung cache"""
+        return {
+            "hits": self.hits_, "disk_hits": self.disk_hits_,
+            "misses": self.misses_, "memory_items": len(self.memory_),
+            "disk_bytes": self.disk_bytes_
+        }
\ No newline at end of file
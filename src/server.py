@@ -0,0 +1,316 @@
+# LIBRARY / MODULE / PUSTAKA
+
+import argparse, asyncio, base64, json, multiprocessing, os, sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from functions import *
+from warnings import simplefilter
+
+simplefilter(action= "ignore", category= FutureWarning)
+
+# TASKS
+
+"""Tasks
+
+Pekerjaan berat (CPU) yang dijalankan di proses worker. Semua masukan dan
+keluaran berupa bytes agar murah dikirim antar proses.
+"""
+
+def keygen_task():
+    return pack_keys(generate_keys())
+
+def embed_task(image, message, bits= 1, codec= "none", self_contained= False, cipher= "hybrid"):
+    keys = generate_keys()
+    mode = CIPHER_MODES[cipher]
+    if self_contained:
+        return embed_secret(image, message, keys, bits, codec, mode= mode), pack_keys(keys), b""
+
+    chipertext = encrypt_chipertext(message, keys, mode)
+    return embed_buffer(image, message, bits, codec= codec), pack_keys(keys), chipertext
+
+def read_task(image, key, chipertext, bits= 1, legacy= True):
+    keys = read_key(key)
+    image = decode_image(image)
+    message = read_secret(image, keys)
+    if message is not None:
+        return None, message
+    if not chipertext:
+        raise ValueError("Gambar tidak berisi chipertext, field 'chipertext' wajib diisi.")
+    return read_buffer(image, bits, legacy), decrypt_chipertext(chipertext, keys)
+
+# SERVICE
+
+class HttpError(Exception):
+    """Error yang dikirim ke klien sebagai respons HTTP"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+class StegoService():
+    """Layanan HTTP asyncio untuk embed, read, dan keygen
+
+    Parameters
+    ----------
+    workers_ : int
+        Jumlah proses worker untuk pekerjaan berat.
+
+    queue_ : int
+        Jumlah maksimum pekerjaan yang sedang berjalan atau menunggu. Permintaan
+        di atas batas ini langsung ditolak dengan status 503.
+
+    timeout_ : float
+        Batas waktu (detik) satu pekerjaan sebelum dijawab dengan status 504.
+        Pekerjaan yang sudah berjalan di worker tetap diselesaikan dan tetap
+        dihitung dalam antrean sampai selesai.
+
+    max_body_ : int
+        Ukuran maksimum body permintaan (dalam byte).
+    """
+
+    ROUTES = ("/embed", "/read", "/keygen")
+
+    STATUS = {
+        200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+        413: "Payload Too Large", 500: "Internal Server Error",
+        503: "Service Unavailable", 504: "Gateway Timeout"
+    }
+
+    def __init__(self, workers_= os.cpu_count(), queue_= 64, timeout_= 120.0, max_body_= 64 * 1024 ** 2):
+        self.workers_ = workers_
+        self.queue_ = queue_
+        self.timeout_ = timeout_
+        self.max_body_ = max_body_
+
+        self.pool_ = self._new_pool()
+        self.pending_ = 0
+
+        ## jalankan worker sekarang agar permintaan pertama tidak menunggu
+        self.pool_.submit(int).result()
+
+    def _new_pool(self):
+        """Pool worker yang tidak mewarisi socket
+
+        Worker dibuat lewat forkserver (atau spawn jika tidak tersedia), bukan
+        fork dari proses layanan, sehingga tidak mewarisi socket server maupun
+        klien, termasuk ketika pool dibuat ulang saat layanan berjalan.
+        """
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        return ProcessPoolExecutor(
+            max_workers= self.workers_, mp_context= multiprocessing.get_context(method)
+        )
+
+    def _restart(self, pool):
+        """Ganti pool yang rusak (misal worker mati kehabisan memori)"""
+        if self.pool_ is pool:
+            METRICS.count("http_pool_restarts")
+            pool.shutdown(wait= False, cancel_futures= True)
+            self.pool_ = self._new_pool()
+        return self.pool_
+
+    def _release(self, loop):
+        """Lepaskan slot antrean ketika pekerjaan di worker benar-benar selesai"""
+        def callback(_):
+            try:
+                loop.call_soon_threadsafe(self._done)
+            except RuntimeError:
+                pass
+        return callback
+
+    def _done(self):
+        self.pending_ -= 1
+
+    async def _offload(self, func, *args):
+        """Jalankan pekerjaan di pool dengan antrean terbatas dan timeout"""
+        if self.pending_ >= self.queue_:
+            METRICS.count("http_rejected")
+            raise HttpError(503, "Antrean penuh, coba lagi nanti.")
+
+        loop = asyncio.get_running_loop()
+        pool = self.pool_
+        try:
+            job = pool.submit(func, *args)
+        except BrokenProcessPool:
+            pool = self._restart(pool)
+            job = pool.submit(func, *args)
+        self.pending_ += 1
+        job.add_done_callback(self._release(loop))
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(job), self.timeout_)
+        except asyncio.TimeoutError:
+            METRICS.count("http_timeouts")
+            raise HttpError(504, "Waktu proses habis.")
+        except BrokenProcessPool:
+            self._restart(pool)
+            raise HttpError(500, "Proses worker berhenti tiba-tiba, coba lagi.")
+        except ValueError as desc:
+            raise HttpError(400, str(desc))
+
+    @staticmethod
+    def _bits(body):
+        """Ambil field opsional `bits` (jumlah bit LSB per kanal)"""
+        bits = body.get("bits", 1)
+        if not isinstance(bits, int) or not 1 <= bits <= 4:
+            raise HttpError(400, "Field 'bits' harus bilangan bulat 1 - 4.")
+        return bits
+
+    @staticmethod
+    def _codec(body):
+        """Ambil field opsional `codec` (kompresi pesan)"""
+        codec = body.get("codec", "none")
+        if codec not in CODECS:
+            raise HttpError(400, f"Field 'codec' harus salah satu dari {list(CODECS)}.")
+        return codec
+
+    @staticmethod
+    def _cipher(body):
+        """Ambil field opsional `cipher` (mode enkripsi chipertext)"""
+        cipher = body.get("cipher", "hybrid")
+        if cipher not in CIPHER_MODES:
+            raise HttpError(400, f"Field 'cipher' harus salah satu dari {list(CIPHER_MODES)}.")
+        return cipher
+
+    @staticmethod
+    def _legacy(body):
+        """Ambil field opsional `legacy` (baca gambar tanpa header)"""
+        legacy = body.get("legacy", True)
+        if not isinstance(legacy, bool):
+            raise HttpError(400, "Field 'legacy' harus bernilai true atau false.")
+        return legacy
+
+    @staticmethod
+    def _field(body, name):
+        """Ambil field base64 dari body JSON"""
+        try:
+            return base64.b64decode(body[name], validate= True)
+        except (KeyError, TypeError, ValueError):
+            raise HttpError(400, f"Field '{name}' (base64) wajib diisi.")
+
+    async def handle(self, method, path, body):
+        """Arahkan permintaan ke endpoint yang sesuai
+
+        Returns
+        -------
+        self : dict
+            Body respons JSON.
+        """
+        if path == "/health":
+            return {"status": "ok", "pending": self.pending_, "workers": self.workers_}
+        if path not in self.ROUTES:
+            raise HttpError(404, "Endpoint tidak ditemukan.")
+        if method != "POST":
+            raise HttpError(405, "Gunakan metode POST.")
+
+        try:
+            body = json.loads(body or b"{}")
+        except ValueError:
+            raise HttpError(400, "Body harus berupa JSON.")
+
+        if path == "/keygen":
+            key = await self._offload(keygen_task)
+            return {"key": base64.b64encode(key).decode()}
+
+        if path == "/embed":
+            image = self._field(body, "image")
+            message = body.get("message")
+            if not isinstance(message, str) or not message.strip():
+                raise HttpError(400, "Field 'message' wajib diisi.")
+
+            image, key, chipertext = await self._offload(
+                embed_task, image, message, self._bits(body), self._codec(body),
+                bool(body.get("self_contained")), self._cipher(body)
+            )
+            response = {
+                "image": base64.b64encode(image).decode(),
+                "key": base64.b64encode(key).decode()
+            }
+            if chipertext:
+                response["chipertext"] = base64.b64encode(chipertext).decode()
+            return response
+
+        image, key = self._field(body, "image"), self._field(body, "key")
+        chipertext = self._field(body, "chipertext") if "chipertext" in body else b""
+        text, message = await self._offload(
+            read_task, image, key, chipertext, self._bits(body), self._legacy(body)
+        )
+        return {"extracted": text, "message": message}
+
+    async def _respond(self, writer, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {self.STATUS[status]}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: close\r\n"
+        )
+        if status == 503:
+            head += "Retry-After: 1\r\n"
+        writer.write((head + "\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+    async def connection(self, reader, writer):
+        """Tangani satu koneksi HTTP/1.1 (satu permintaan per koneksi)"""
+        try:
+            try:
+                request = await reader.readuntil(b"\r\n\r\n")
+                lines = request.decode("latin-1").split("\r\n")
+                method, path, _ = lines[0].split(" ", 2)
+
+                headers = {}
+                for line in lines[1:]:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                if length > self.max_body_:
+                    raise HttpError(413, "Body terlalu besar.")
+                body = await reader.readexactly(length) if length else b""
+
+                stage = path.strip("/") if path in self.ROUTES else "other"
+                with METRICS.stage(f"http_{stage}"):
+                    status, payload = 200, await self.handle(method, path, body)
+            except HttpError as desc:
+                status, payload = desc.status, {"error": str(desc)}
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+                status, payload = 400, {"error": "Permintaan HTTP tidak valid."}
+            except Exception:
+                METRICS.count("http_errors")
+                LOGGER.exception("Permintaan HTTP gagal")
+                status, payload = 500, {"error": "Terjadi kesalahan internal."}
+            await self._respond(writer, status, payload)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host, port):
+        server = await asyncio.start_server(self.connection, host, port)
+        print(f"Melayani di http://{host}:{port} dengan {self.workers_} worker")
+        async with server:
+            await server.serve_forever()
+
+# MAIN PROGRAM
+
+def main(argv= None):
+    parser = argparse.ArgumentParser(description= "Layanan HTTP untuk embed, read, dan keygen.")
+    parser.add_argument("--host", default= "127.0.0.1")
+    parser.add_argument("--port", type= int, default= 8080)
+    parser.add_argument("--workers", type= int, default= os.cpu_count())
+    parser.add_argument("--queue", type= int, default= 64, help= "Batas pekerjaan aktif + menunggu.")
+    parser.add_argument("--timeout", type= float, default= 120.0, help= "Batas waktu per pekerjaan (detik).")
+    parser.add_argument("--max-body", type= int, default= 64 * 1024 ** 2)
+    args = parser.parse_args(argv)
+
+    service = StegoService(args.workers, args.queue, args.timeout, args.max_body)
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.pool_.shutdown(cancel_futures= True)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())